@@ -2,12 +2,15 @@ import streamlit as st  # type: ignore
 import gspread  # type: ignore
 from oauth2client.service_account import ServiceAccountCredentials  # type: ignore
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, Counter
+from functools import lru_cache
 import re
 import pandas as pd  # type: ignore
 import logging
 import json
+import hmac
 import os
+import time
 from typing import List, Dict, Optional
 from zoneinfo import ZoneInfo  # type: ignore
 from datetime import timedelta
@@ -16,8 +19,37 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 TIMEZONE = ZoneInfo('Asia/Singapore')  
 USER_DB_PATH = "users.json"
+# Seconds a loaded user database is reused; revoked or changed users take effect within this window
+USER_DB_CACHE_TTL = 300
 NON_CMD_RANKS = ["PTE", "LCP", "CPL", "CFC", "REC", "SCT"]
 
+# Precompiled patterns for the hot normalization helpers
+_NONWORD_RE = re.compile(r'\W+')
+_NONDIGIT_RE = re.compile(r'\D')
+_PAREN_GROUP_RE = re.compile(r"\(([^)]*)\)")
+_OTHERS_REASON_SPLIT_RE = re.compile(r'[-:]')
+# Stored conduct pointers ("Observation 1: ...") and numbered conduct series ("IPPT 3")
+_POINTER_OBS_RE = re.compile(r'Observation\s*\d*:\s*([\s\S]*?)(?:\n|$)', re.IGNORECASE)
+_POINTER_REFL_RE = re.compile(r'Reflection\s*\d*:\s*([\s\S]*?)(?:\n|$)', re.IGNORECASE)
+_POINTER_REC_RE = re.compile(r'Recommendation\s*\d*:\s*([\s\S]*?)(?:\n|$)', re.IGNORECASE)
+_CONDUCT_SERIES_RE = re.compile(r'^(.*\S)\s+(\d+)$')
+# Leading 4D number on a stored outlier entry ("4D1106 NG YONG ZHENG")
+_OUTLIER_4D_PREFIX_RE = re.compile(r'^4D[0-9A-Za-z]+\s+(.*)$', re.IGNORECASE)
+
+# Display labels for platoon keys in companies that don't use "Platoon N"; built once here
+# instead of per platoon inside the message and Analytics loops
+_COMPANY_PLATOON_LABELS = {
+    "Support": {"1": "SIGNAL PL", "2": "SCOUT PL", "3": "PIONEER PL", "4": "MORTAR PL"},
+    "HQ": {"S1": "S1 Branch", "S2": "S2 Branch", "S3": "S3 Branch", "S4": "S4 Branch",
+           "SSP": "SSP", "BCS": "BCS", "1": "UIP"},
+    "Bravo": {"1": "Plt 6", "2": "Plt 7", "3": "Plt 8", "4": "Plt 9", "5": "Plt 10"},
+    "Charlie": {"1": "Plt 11", "2": "Plt 12", "3": "Plt 13", "4": "Plt 14", "5": "Plt 15"},
+}
+
+# Canonical RSI/RSO reasons offered in the dropdowns, plus a case-insensitive lookup
+RSI_RSO_REASONS = ["Musculoskeletal", "Psychological", "Dermatological", "Headache", "URTI", "GE", "Others"]
+_RSI_RSO_REASONS_BY_LOWER = {r.lower(): r for r in RSI_RSO_REASONS}
+
 LEGEND_STATUS_PREFIXES = {
         "ol": "[OL]",   # Overseas Leave
         "ll": "[LL]",   # Local Leave
@@ -33,10 +65,38 @@ LEGEND_STATUS_PREFIXES = {
         "hl": "[HL]",   # Hospitalisation Leave
         "others": "[Others]",   # Hospitalisation Leave
     }
+
+@lru_cache(maxsize=256)
+def _parade_status_category(status: str) -> str:
+    """
+    Bucket a Parade_State status for the parade state messages:
+    'legend' if its first word is a LEGEND_STATUS_PREFIXES key (counts as absent),
+    'rsi_rso' for bare RSI/RSO entries (not listed), otherwise 'other'.
+    The same handful of statuses repeat across the roll, so the result is cached.
+    """
+    status_words = status.lower().split()
+    if status_words and status_words[0] in LEGEND_STATUS_PREFIXES:
+        return 'legend'
+    # Bare RSI/RSO, with or without a reason in parentheses, e.g. "RSI", "RSO (Dermatological)";
+    # "EX HEAVY LOAD", "MC RSI" and "ML RSO" are listed as other statuses
+    status_upper = status.strip().upper()
+    if status_upper in ('RSI', 'RSO') or status_upper.startswith(('RSI (', 'RSO (', '(RSI', '(RSO')):
+        return 'rsi_rso'
+    return 'other'
+
 def parse_existing_outliers(existing_outliers_str):
     """
     Splits on commas (top-level), extracts parentheses as 'status_desc',
     and treats the rest as the name (with optional leading '4Dxxx' stripped).
+    Returns fresh dicts so callers can't mutate the cached parse.
+    """
+    return {key: dict(info) for key, info in _parse_outliers(existing_outliers_str).items()}
+
+@lru_cache(maxsize=512)
+def _parse_outliers(existing_outliers_str):
+    """
+    Cached core of parse_existing_outliers; the same outlier strings are re-parsed
+    on every rerun while a conduct is loaded in Update Conduct.
     """
 
     # If the string is just "none", return an empty dict.
@@ -48,6 +108,14 @@ def parse_existing_outliers(existing_outliers_str):
         Splits the string on commas that are NOT inside any parentheses (including nested).
         E.g. "ABC (1,2), DEF" => ["ABC (1,2)", "DEF"].
         """
+        if '(' not in s and ')' not in s:
+            # No parentheses, so every comma is top-level: let str.split do it in one pass.
+            # A trailing comma leaves no final piece, matching the loop below.
+            parts = [part.strip() for part in s.split(',')]
+            if not s or s.endswith(','):
+                parts.pop()
+            return parts
+
         parts = []
         current = []
         depth = 0
@@ -129,7 +197,7 @@ def parse_existing_outliers(existing_outliers_str):
         remainder = remainder.strip()
         # Use a regex like:  ^4D[0-9A-Za-z]+\s+(.*)
         # If it matches, we drop that "4Dxxxx" portion from the name.
-        match_4d = re.match(r'^4D[0-9A-Za-z]+\s+(.*)$', remainder, flags=re.IGNORECASE)
+        match_4d = _OUTLIER_4D_PREFIX_RE.match(remainder)
         if match_4d:
             name_str = match_4d.group(1).strip()
         else:
@@ -144,10 +212,13 @@ def parse_existing_outliers(existing_outliers_str):
         }
 
     return outliers_dict
+@st.cache_data(ttl=USER_DB_CACHE_TTL)
 def load_user_db():
     """
     Load the user database from Streamlit secrets.
     Falls back to JSON file for local development if secrets not available.
+    Cached for USER_DB_CACHE_TTL seconds so reruns don't re-walk secrets or re-read users.json,
+    while edits to either (e.g. revoking a user) still apply without a restart.
     """
     try:
         # Try to load from Streamlit secrets first
@@ -179,19 +250,25 @@ def load_user_db():
 USER_DB = load_user_db()
 
 
-if 'authenticated' not in st.session_state:
-    st.session_state.authenticated = False
-if 'username' not in st.session_state:
-    st.session_state.username = ""
-if 'user_companies' not in st.session_state:
-    st.session_state.user_companies = []
+for key, default in {"authenticated": False, "username": "", "user_companies": []}.items():
+    st.session_state.setdefault(key, default)
+
+def _password_matches(stored_password, password: str) -> bool:
+    """
+    Constant-time comparison so response timing doesn't reveal how much of a password matched.
+    Only string passwords can match, as with the plain == comparison this replaced.
+    """
+    if not isinstance(stored_password, str):
+        logger.warning("Stored password is not a string; rejecting login.")
+        return False
+    return hmac.compare_digest(stored_password.encode("utf-8"), password.encode("utf-8"))
 
 def login():
     st.title("🔒 1SIRTracker")
     username = st.text_input("Username")
     password = st.text_input("Password", type="password")
     if st.button("Login"):
-        if username in USER_DB and USER_DB[username]["password"] == password:
+        if username in USER_DB and _password_matches(USER_DB[username]["password"], password):
             st.session_state.authenticated = True
             st.session_state.username = username
             st.session_state.user_companies = USER_DB[username]["companies"]
@@ -204,7 +281,7 @@ def login():
             logger.warning(f"Failed login attempt for username '{username}'.")
 
 def logout():
-    st.sidebar.button("Logout", on_click=lambda: logout_callback())
+    st.sidebar.button("Logout", on_click=logout_callback)
 
 def logout_callback():
     st.session_state.authenticated = False
@@ -212,7 +289,8 @@ def logout_callback():
     st.session_state.user_companies = []
     st.success("You have been logged out.")
     logger.info("User logged out.")
-    st.rerun()
+    # No st.rerun() here: Streamlit already reruns after an on_click callback, and that rerun
+    # stops at the login gate before any sheets are opened
 
 if not st.session_state.authenticated:
     login()
@@ -384,32 +462,25 @@ def add_conduct_column_everything(sheet_everything, conduct_date: str, conduct_n
         if not all_data:
             raise ValueError("No data found in Everything sheet")
         
-        # Get current number of columns and add new header
+        # Get current number of columns; the new header goes in row 1 of the next column
         new_col_index = len(all_data[0]) + 1
-        sheet_everything.update_cell(1, new_col_index, new_col_header)
         
         # Create a mapping of names to their attendance status
         attendance_map = {name: attendance_status for name, rank, attendance_status in attendance_data}
         
-        # Prepare batch updates
-        updates = []
-        for row_idx, row in enumerate(all_data[1:], start=2):  # Start from row 2
+        # Build the whole column (header + one value per person) for a single range write
+        column_values = [[new_col_header]]
+        for row in all_data[1:]:  # Start from row 2
             name = row[2].strip()  # Assuming Name is in second column
-            # Check if this person was in the conduct
-            if name in attendance_map:
-                value = attendance_map[name]  # "Yes", "No", or "N/A"
-            else:
-                value = ""  # Default to empty if person wasn't in the conduct
-            
-            cell = gspread.utils.rowcol_to_a1(row_idx, new_col_index)
-            updates.append({
-                'range': cell,
-                'values': [[value]]
-            })
+            # "Yes", "No", or "N/A"; empty if person wasn't in the conduct
+            column_values.append([attendance_map.get(name, "")])
         
-        # Batch update the sheet
-        if updates:
-            sheet_everything.batch_update(updates)
+        column_range = (
+            f"{gspread.utils.rowcol_to_a1(1, new_col_index)}:"
+            f"{gspread.utils.rowcol_to_a1(len(column_values), new_col_index)}"
+        )
+        sheet_everything.batch_update([{'range': column_range, 'values': column_values}])
+        # The caller clears this sheet's cache with clear_sheet_caches once it is done writing
             
     except Exception as e:
         logger.error(f"Error updating Everything sheet: {str(e)}")
@@ -461,12 +532,21 @@ def update_conduct_column_everything(sheet_everything, conduct_date: str, conduc
         # Batch update the sheet
         if updates:
             sheet_everything.batch_update(updates)
+        # The caller clears this sheet's cache with clear_sheet_caches once it is done writing
             
     except Exception as e:
         logger.error(f"Error updating Everything sheet: {str(e)}")
         st.error(f"Error updating Everything sheet: {str(e)}")
         return
 @st.cache_resource
+def get_gspread_client():
+    """
+    Authorize the service account once per process; every company's spreadsheet is opened
+    through this shared client so switching companies doesn't repeat the OAuth handshake.
+    """
+    return gspread.authorize(creds)
+
+@st.cache_resource
 def get_sheets(selected_company: str):
     """
     Open the spreadsheet based on the selected company and return references to worksheets.
@@ -478,8 +558,7 @@ def get_sheets(selected_company: str):
         st.error(f"Spreadsheet for company '{selected_company}' not found.")
         return None
     try:
-        gc = gspread.authorize(creds)
-        sh = gc.open(spreadsheet_name)
+        sh = get_gspread_client().open(spreadsheet_name)
 
         # Helper to get or create a worksheet; optionally seed headers
         def _get_or_create(ws_title: str, headers: Optional[List[str]] = None):
@@ -529,11 +608,19 @@ def generate_battalion_message(target_date: Optional[datetime] = None) -> str:
             if not worksheets:
                 continue
                 
-            # Get records for this company
+            # Get records for this company; both sheets come back in one batched read
+            prefetch_sheet_values(company, [worksheets["nominal"], worksheets["parade"]])
             company_nominal = get_nominal_records(company, worksheets["nominal"])
             company_parade = get_allparade_records(company, worksheets["parade"])
             
             # For battalion message, include all personnel including UIP from HQ
+
+            # Group the company's parade records by name once so each person only checks their own
+            # statuses instead of scanning the whole Parade_State (names are stripped on load)
+            parades_by_name = defaultdict(list)
+            for parade in company_parade:
+                parades_by_name[parade['name'].lower()].append(parade)
+            today_date = today.date()
             
             # Process each person in the company
             for record in company_nominal:
@@ -543,20 +630,16 @@ def generate_battalion_message(target_date: Optional[datetime] = None) -> str:
                 # Check if person is absent (has active parade status)
                 is_absent = False
                 name_key = name.lower()
-                for parade in company_parade:
-                    if parade.get('name', '').strip().lower() == name_key:
-                        start_str = parade.get('start_date_ddmmyyyy', '')
-                        end_str = parade.get('end_date_ddmmyyyy', '')
-                        try:
-                            start_dt = datetime.strptime(start_str, "%d%m%Y").date()
-                            end_dt = datetime.strptime(end_str, "%d%m%Y").date()
-                            if start_dt <= today.date() <= end_dt:
-                                status_prefix = parade.get('status', '').lower().split()[0]
-                                if status_prefix in LEGEND_STATUS_PREFIXES:
-                                    is_absent = True
-                                    break
-                        except ValueError:
-                            continue
+                for parade in parades_by_name.get(name_key, ()):
+                    # Dates are pre-parsed by the loader; None means the start date was invalid
+                    start_dt = parade.get('_start_dt')
+                    end_dt = parade.get('_end_dt')
+                    if start_dt is None or end_dt is None:
+                        continue
+                    if start_dt <= today_date <= end_dt:
+                        if _parade_status_category(parade.get('status', '')) == 'legend':
+                            is_absent = True
+                            break
                 
                 # Check if person is SSP by their platoon assignment in the nominal roll
                 is_ssp = record.get('platoon', '').strip().upper() == 'SSP'
@@ -639,8 +722,13 @@ def generate_company_message(selected_company: str, nominal_records: List[Dict],
         if record['name']
     }
 
+    # Group the company's nominal roll by platoon once; the per-platoon strengths below read from it
+    nominal_by_platoon = defaultdict(list)
+    for record in company_nominal_records:
+        nominal_by_platoon[record.get('platoon', 'Coy HQ')].append(record)
+
     # Extract all platoons from nominal records for the selected company
-    all_platoons = set(record.get('platoon', 'Coy HQ') for record in company_nominal_records)
+    all_platoons = set(nominal_by_platoon)
     
     # Filter out platoon "1" for HQ company (UIP)
     if selected_company == "HQ":
@@ -648,35 +736,41 @@ def generate_company_message(selected_company: str, nominal_records: List[Dict],
 
     # Initialize a dictionary to hold parade records active today, organized by platoon
     active_parade_by_platoon = defaultdict(list)
+    # Everyone absent on the day under a legend status (all platoons), for the rank breakdown below;
+    # collected in this same pass so the parade records are only filtered by date once
+    absent_names = set()
+    today_date = today.date()
 
     # Process parade records to find those active today and organize them by platoon
     for parade in parade_records:
         if parade.get('company', '') != selected_company:
             continue
 
+        start_dt = parade.get('_start_dt')
+        end_dt = parade.get('_end_dt')
+        if start_dt is not None and end_dt is not None and start_dt <= today_date <= end_dt:
+            if _parade_status_category(parade.get('status', '')) == 'legend':
+                absent_names.add(parade.get('name', '').strip().lower())
+
         platoon = parade.get('platoon', 'Coy HQ')  # Default to 'Coy HQ' if not specified
         
         # Skip platoon "1" for HQ company
         if selected_company == "HQ" and platoon == "1":
             continue
 
-        start_str = parade.get('start_date_ddmmyyyy', '')
-        end_str = parade.get('end_date_ddmmyyyy', '')
-        try:
-            start_dt = datetime.strptime(start_str, "%d%m%Y").date()
-            end_dt = datetime.strptime(end_str, "%d%m%Y").date()
-            if start_dt <= today.date() <= end_dt:
-                active_parade_by_platoon[platoon].append(parade)
-        except ValueError:
+        if start_dt is None or end_dt is None:
             logger.warning(
-                f"Invalid date format for {parade.get('name', '')}: {start_str} - {end_str} in company '{selected_company}'"
+                f"Invalid date format for {parade.get('name', '')}: "
+                f"{parade.get('start_date_ddmmyyyy', '')} - {parade.get('end_date_ddmmyyyy', '')} in company '{selected_company}'"
             )
             continue
+        if start_dt <= today_date <= end_dt:
+            active_parade_by_platoon[platoon].append(parade)
 
     # Initialize counters for overall nominal and absent strengths
     # Exclude platoon "1" personnel from HQ company total
     if selected_company == "HQ":
-        total_nominal = len([r for r in company_nominal_records if r.get('platoon', 'Coy HQ') != "1"])
+        total_nominal = len(company_nominal_records) - len(nominal_by_platoon.get("1", []))
     else:
         total_nominal = len(company_nominal_records)
     total_absent = 0
@@ -693,50 +787,19 @@ def generate_company_message(selected_company: str, nominal_records: List[Dict],
         if platoon.lower() in ('coy hq', 'hq'):
             platoon_label = "Coy HQ"
         elif selected_company == "Support":
-            support_platoon_map = {
-                "1": "SIGNAL PL",
-                "2": "SCOUT PL",
-                "3": "PIONEER PL",
-                "4": "MORTAR PL"
-            }
-            platoon_label = support_platoon_map.get(platoon, f"Platoon {platoon}")
+            platoon_label = _COMPANY_PLATOON_LABELS["Support"].get(platoon, f"Platoon {platoon}")
         elif selected_company == "HQ":
-            hq_branch_map = {
-                "S1": "S1 Branch",
-                "S2": "S2 Branch",
-                "S3": "S3 Branch",
-                "S4": "S4 Branch",
-                "SSP": "SSP",
-                "BCS": "BCS",
-                "1": "UIP"
-            }
-            platoon_label = hq_branch_map.get(platoon, f"S{platoon} Branch")
+            platoon_label = _COMPANY_PLATOON_LABELS["HQ"].get(platoon, f"S{platoon} Branch")
         elif selected_company == "Bravo":
-            bravo_platoon_map = {
-                "1": "Plt 6",
-                "2": "Plt 7",
-                "3": "Plt 8",
-                "4": "Plt 9",
-                "5": "Plt 10"
-            }
-            platoon_label = bravo_platoon_map.get(platoon, f"Plt {int(platoon) + 5}")
+            platoon_label = _COMPANY_PLATOON_LABELS["Bravo"].get(platoon) or f"Plt {int(platoon) + 5}"
         elif selected_company == "Charlie":
-            charlie_platoon_map = {
-                "1": "Plt 11",
-                "2": "Plt 12",
-                "3": "Plt 13",
-                "4": "Plt 14",
-                "5": "Plt 15"
-            }
-            platoon_label = charlie_platoon_map.get(platoon, f"Plt 1{platoon}")
+            platoon_label = _COMPANY_PLATOON_LABELS["Charlie"].get(platoon, f"Plt 1{platoon}")
         else:
             platoon_label = f"Platoon {platoon}"
 
         # Total nominal strength for this platoon
-        platoon_nominal = len([
-            record for record in company_nominal_records
-            if record.get('platoon', 'Coy HQ') == platoon
-        ])
+        platoon_nominal_records = nominal_by_platoon[platoon]
+        platoon_nominal = len(platoon_nominal_records)
 
         # Initialize lists for conformant absentees split into commander and non-cmd,
         # plus non-conformant parade records (to be shown under "Pl Statuses")
@@ -749,63 +812,34 @@ def generate_company_message(selected_company: str, nominal_records: List[Dict],
             name_key = name.strip().lower()
             status = parade.get('status', '').upper()
             d = parade.get('4d_number', '')
-            start_str = parade.get('start_date_ddmmyyyy', '')
-            end_str = parade.get('end_date_ddmmyyyy', '')
-            try:
-                start_dt = datetime.strptime(start_str, "%d%m%Y").date()
-                end_dt = datetime.strptime(end_str, "%d%m%Y").date()
-                if start_dt == end_dt:
-                    details = f"{start_dt.strftime('%d%m%y')}"
-                else:
-                    details = f"{start_dt.strftime('%d%m%y')} - {end_dt.strftime('%d%m%y')}"
-            except ValueError:
-                details = "Invalid Dates"
-                logger.warning(
-                    f"Invalid dates for {name}: {start_str} - {end_str} in company '{selected_company}'"
-                )
+            # Only records with both dates parsed were kept as active above
+            start_dt = parade['_start_dt']
+            end_dt = parade['_end_dt']
+            if start_dt == end_dt:
+                details = f"{start_dt.strftime('%d%m%y')}"
+            else:
+                details = f"{start_dt.strftime('%d%m%y')} - {end_dt.strftime('%d%m%y')}"
             # Look up the nominal rank; default to "N/A" if not found
             rank = name_to_rank.get(name_key, "N/A")
-            status_prefix = status.lower().split()[0]
-            if status_prefix in LEGEND_STATUS_PREFIXES:
+            status_category = _parade_status_category(status)
+            # Entries that are ONLY "RSI" or "RSO" are not listed
+            if status_category == 'rsi_rso':
+                continue
+            absentee = {
+                'rank': rank,
+                '4d': d,
+                'name': name,
+                'status': status,
+                'details': details
+            }
+            if status_category == 'legend':
                 # Split conformant absentees by whether their rank indicates a non-cmd
                 if rank.upper() in NON_CMD_RANKS:
-                    non_cmd_absentees.append({
-                        'rank': rank,
-                        '4d': d,
-                        'name': name,
-                        'status': status,
-                        'details': details
-                    })
+                    non_cmd_absentees.append(absentee)
                 else:
-                    commander_absentees.append({
-                        'rank': rank,
-                        '4d': d,
-                        'name': name,
-                        'status': status,
-                        'details': details
-                    })
+                    commander_absentees.append(absentee)
             else:
-                # Skip entries that are ONLY "RSI" or "RSO" (with or without reason in parentheses)
-                # Examples to skip: "RSI", "RSO", "RSI (Dermatological)", "RSO (Musculoskeletal)"
-                # Examples to keep: "EX HEAVY LOAD", "MC RSI", "ML RSO"
-                status_upper = status.strip().upper()
-                # Check if status starts with RSI or RSO (possibly followed by space and parentheses)
-                is_only_rsi_rso = (
-                    status_upper == 'RSI' or
-                    status_upper == 'RSO' or
-                    status_upper.startswith('RSI (') or
-                    status_upper.startswith('RSO (') or
-                    status_upper.startswith('(RSI') or
-                    status_upper.startswith('(RSO')
-                )
-                if not is_only_rsi_rso:
-                    non_conformant_absentees.append({
-                        'rank': rank,
-                        '4d': d,
-                        'name': name,
-                        'status': status,
-                        'details': details
-                    })
+                non_conformant_absentees.append(absentee)
 
         # Total absent strength only counts conformant absentees
         commander_group = defaultdict(list)
@@ -830,16 +864,10 @@ def generate_company_message(selected_company: str, nominal_records: List[Dict],
         total_absent += platoon_absent
 
         # Calculate nominal breakdown based on rank for all platoons including Coy HQ
-        platoon_nominal_records = [
-            r for r in company_nominal_records
-            if r.get('platoon', 'Coy HQ') == platoon
-        ]
-        commander_nominal = sum(
-            1 for r in platoon_nominal_records if r.get('rank', '').upper() not in NON_CMD_RANKS
-        )
         non_cmd_nominal = sum(
             1 for r in platoon_nominal_records if r.get('rank', '').upper() in NON_CMD_RANKS
         )
+        commander_nominal = platoon_nominal - non_cmd_nominal
 
         platoon_details.append({
             'label': platoon_label,
@@ -877,22 +905,7 @@ def generate_company_message(selected_company: str, nominal_records: List[Dict],
             continue
 
         # Check if person is absent (has active parade status)
-        is_absent = False
-        name_key = name.lower()
-        for parade in parade_records:
-            if parade.get('company', '') == selected_company and parade.get('name', '').strip().lower() == name_key:
-                start_str = parade.get('start_date_ddmmyyyy', '')
-                end_str = parade.get('end_date_ddmmyyyy', '')
-                try:
-                    start_dt = datetime.strptime(start_str, "%d%m%Y").date()
-                    end_dt = datetime.strptime(end_str, "%d%m%Y").date()
-                    if start_dt <= today.date() <= end_dt:
-                        status_prefix = parade.get('status', '').lower().split()[0]
-                        if status_prefix in LEGEND_STATUS_PREFIXES:
-                            is_absent = True
-                            break
-                except ValueError:
-                    continue
+        is_absent = name.lower() in absent_names
 
         if rank in officer_ranks:
             if is_absent:
@@ -1003,11 +1016,20 @@ def is_valid_4d(four_d: str) -> str:
     If the '4D' prefix is missing, add it.
     Returns the formatted 4D_Number if valid, else returns an empty string.
     """
-    four_d = ensure_str(four_d).upper()
+    return _format_4d(ensure_str(four_d))
+
+@lru_cache(maxsize=4096)
+def _format_4d(four_d: str) -> str:
+    """
+    Cached core of is_valid_4d; the same 4D numbers recur across Nominal_Roll,
+    Parade_State and Conducts. An invalid value is only logged the first time it is seen.
+    """
+    four_d = four_d.upper()
     if not four_d.startswith('4D'):
         four_d = f'4D{four_d}'
     
-    if re.match(r'^4D\d+$', four_d):
+    # "4D" followed by digits only; isdecimal() matches the same characters as \d
+    if four_d[2:].isdecimal():
         return four_d
     else:
         # We log an error if it "looks" invalid, but we won't remove it from nominal if blank
@@ -1021,60 +1043,134 @@ def ensure_date_str(date_value) -> str:
     If the input is an integer or float, convert it to a string with leading zeros.
     If it's a string, pad with leading zeros if necessary.
     """
+    # Fast path: sheet cells are nearly always already 8-digit strings
+    if type(date_value) is str and len(date_value) == 8 and date_value.isdecimal():
+        return date_value
     if isinstance(date_value, int):
         return f"{date_value:08d}"
     elif isinstance(date_value, float):
         return f"{int(date_value):08d}"
     elif isinstance(date_value, str):
-        cleaned = re.sub(r'\D', '', date_value)
-        return cleaned.zfill(8)
+        return _date_str_from_str(date_value)
     else:
         return ""
 
+@lru_cache(maxsize=4096)
+def _date_str_from_str(date_value: str) -> str:
+    """Cached string branch of ensure_date_str; sheets repeat the same handful of dates."""
+    cleaned = _NONDIGIT_RE.sub('', date_value)
+    return cleaned.zfill(8)
+
+@lru_cache(maxsize=4096)
+def _parse_ddmmyyyy(date_str: str) -> datetime:
+    """
+    Parse a zero-padded DDMMYYYY string by slicing instead of going through strptime.
+    Raises ValueError for anything that is not exactly 8 digits or not a real date.
+    Cached since conduct headers and parade rows repeat the same dates; datetimes are immutable.
+    """
+    if len(date_str) != 8 or not date_str.isdigit():
+        raise ValueError(f"Invalid DDMMYYYY date: {date_str!r}")
+    return datetime(int(date_str[4:8]), int(date_str[2:4]), int(date_str[0:2]))
+
+@lru_cache(maxsize=4096)
+def conduct_header_date(conduct_header: str):
+    """
+    Date of an Everything conduct header ("DDMMYYYY, CONDUCT NAME"), or None if the header is malformed.
+    Cached since every Analytics view filters the same headers by date.
+    """
+    try:
+        return _parse_ddmmyyyy(conduct_header.split(',')[0].strip()).date()
+    except ValueError:
+        return None
+
+def _fast_date(date_value) -> Optional[datetime]:
+    """
+    Parse a DDMMYYYY value through the cached _parse_ddmmyyyy, returning None if it is not a valid date.
+    """
+    try:
+        return _parse_ddmmyyyy(ensure_date_str(date_value))
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize by uppercase + removing spaces and special characters."""
-    return re.sub(r'\W+', '', name.upper())
+    upper = name.upper()
+    # Single-word names need no stripping; isalnum() is \w minus '_', so this is exact
+    if upper.isalnum():
+        return upper
+    return _NONWORD_RE.sub('', upper)
 
-def get_nominal_records(selected_company: str, _sheet_nominal):
+def categorize_conduct_headers(conduct_headers, requirements: Dict) -> Dict[str, List[str]]:
+    """
+    Map each conduct header to the requirement categories (in definition order) whose
+    keywords appear in it, case-insensitively. The keywords are lowercased once for the
+    whole batch and each distinct header is matched only once.
+    """
+    category_keywords = [
+        (category, tuple(keyword.lower() for keyword in req["keywords"]))
+        for category, req in requirements.items()
+    ]
+    header_categories = {}
+    for conduct_header in conduct_headers:
+        if conduct_header in header_categories:
+            continue
+        conduct_name = conduct_header.lower()
+        header_categories[conduct_header] = [
+            category for category, keywords in category_keywords
+            if any(keyword in conduct_name for keyword in keywords)
+        ]
+    return header_categories
+
+# Nominal_Roll and Parade_State text columns that are stripped on load
+_NOMINAL_TEXT_FIELDS = ('rank', 'name', 'platoon', 'dates taken')
+_PARADE_TEXT_FIELDS = ('name', 'platoon', '4d_number', 'status')
+
+def _load_nominal_records(selected_company: str, all_values: List[List[str]]):
     """
-    Returns all rows from Nominal_Roll as a list of dicts.
+    Returns all rows from Nominal_Roll (its get_all_values(), header row first) as a list of dicts.
     Handles case-insensitive and whitespace-trimmed headers.no 
     Includes the 'company' field in each record.
     """
-    records = _sheet_nominal.get_all_records()
-    if not records:
+    if not all_values or len(all_values) < 2:
         logger.warning(f"No records found in Nominal_Roll for company '{selected_company}'.")
         return []
     
-    # Normalize keys: strip spaces and convert to lower case
+    # Normalize keys once: strip spaces and convert to lower case
+    header = [h.strip().lower() for h in all_values[0]]
+    width = len(header)
     normalized_records = []
-    for row in records:
-        normalized_row = {k.strip().lower(): v for k, v in row.items()}
-        normalized_row['rank'] = ensure_str(normalized_row.get('rank', ''))
-        normalized_row['name'] = ensure_str(normalized_row.get('name', ''))
-        normalized_row['4d_number'] = is_valid_4d(normalized_row.get('4d_number', ''))
-        normalized_row['platoon'] = ensure_str(normalized_row.get('platoon', ''))
-        normalized_row['dates taken'] = ensure_str(normalized_row.get('dates taken', ''))
+    for idx, row in enumerate(all_values[1:], start=2):  # Start at row 2 in Google Sheets
+        # Pad short rows so missing trailing cells read as blank
+        normalized_row = dict(zip(header, row + [''] * (width - len(row))))
+        normalized_row['_row_num'] = idx
+        # Cells are already strings, so stripping is all the coercion these need
+        for key in _NOMINAL_TEXT_FIELDS:
+            normalized_row[key] = normalized_row.get(key, '').strip()
+        normalized_row['4d_number'] = _format_4d(normalized_row.get('4d_number', '').strip())
+        normalized_row['_platoon_norm'] = normalize_name(normalized_row['platoon'])
         normalized_row['company'] = selected_company  # Add company information
         normalized_records.append(normalized_row)
     
     return normalized_records
 
-def get_checklist_records(_sheet_checklist):
+def get_checklist_records(selected_company: str, _sheet_checklist):
     """
     Load existing Checklist rows into a dict keyed by (Date, Conduct).
+    The sheet is read through the shared values cache like the other worksheets.
     Returns a dict: {(date_str, conduct_name): {<column>: value, ..., '_row_num': N}}
     """
     try:
-        all_vals = _sheet_checklist.get_all_values()
+        all_vals = _sheet_values_entry(selected_company, _sheet_checklist)[1]
     except Exception as e:
         logger.error(f"Error reading Checklist sheet: {e}")
         return {}
 
-    if not all_vals:
+    if not all_vals or not any(all_vals[0]):
         # Seed header if the sheet is empty
         try:
             _sheet_checklist.update('A1', [CHECKLIST_COLUMNS])
+            clear_sheet_caches(selected_company, _sheet_checklist)
         except Exception:
             pass
         return {}
@@ -1105,28 +1201,41 @@ def save_checklist_records(_sheet_checklist, rows: List[Dict]):
     """
     Save a list of checklist rows to the Checklist sheet.
     Each row is a dict with keys from CHECKLIST_COLUMNS.
-    If a row contains '_row_num', that row will be updated in-place; otherwise, it's appended.
+    A row whose (Date, Conduct) is already on the sheet is updated in-place; otherwise, it's appended.
+    Row numbers come from a fresh read here, not the (possibly cached) '_row_num' the rows were
+    displayed with, so rows added or removed by another session are not overwritten.
     Returns: (num_updated, num_appended)
     """
     try:
+        all_vals = _sheet_checklist.get_all_values()
         # Ensure header exists in the sheet
-        existing_values = _sheet_checklist.get_all_values()
-        if not existing_values:
+        if not all_vals or not any(all_vals[0]):
             _sheet_checklist.update('A1', [CHECKLIST_COLUMNS])
-            existing_values = [CHECKLIST_COLUMNS]
-        header = existing_values[0]
+            all_vals = [CHECKLIST_COLUMNS]
     except Exception as e:
         logger.error(f"Error accessing Checklist sheet for save: {e}")
         st.error(f"Error accessing Checklist sheet: {e}")
         return (0, 0)
 
+    # Current sheet row of each (Date, Conduct), keyed as in get_checklist_records (later duplicates win)
+    idx_map = {name.strip(): i for i, name in enumerate(all_vals[0])}
+    date_idx = idx_map.get('Date')
+    conduct_idx = idx_map.get('Conduct')
+    current_row_nums = {}
+    for row_idx, row in enumerate(all_vals[1:], start=2):
+        conduct_name = row[conduct_idx].strip() if (conduct_idx is not None and conduct_idx < len(row)) else ""
+        if not conduct_name:
+            continue
+        date_str = ensure_date_str(row[date_idx].strip() if (date_idx is not None and date_idx < len(row)) else "")
+        current_row_nums[(date_str, conduct_name)] = row_idx
+
     updates = []
     append_payload = []
 
     for r in rows:
         # Build row values in our canonical column order
         values = [ensure_str(r.get(col, '')) for col in CHECKLIST_COLUMNS]
-        row_num = r.get('_row_num')
+        row_num = current_row_nums.get((ensure_date_str(r.get('Date', '')), ensure_str(r.get('Conduct', ''))))
         if row_num:
             start = gspread.utils.rowcol_to_a1(int(row_num), 1)
             end = gspread.utils.rowcol_to_a1(int(row_num), len(CHECKLIST_COLUMNS))
@@ -1147,69 +1256,81 @@ def save_checklist_records(_sheet_checklist, rows: List[Dict]):
         except Exception as e:
             logger.error(f"Error batch-updating Checklist rows: {e}")
             st.error(f"Error updating Checklist rows: {e}")
-    for row_values in append_payload:
+    if append_payload:
         try:
-            _sheet_checklist.append_row(row_values)
-            appended += 1
+            _sheet_checklist.append_rows(append_payload)
+            appended = len(append_payload)
         except Exception as e:
-            logger.error(f"Error appending Checklist row: {e}")
-            st.error(f"Error appending Checklist row: {e}")
+            logger.error(f"Error appending Checklist rows: {e}")
+            st.error(f"Error appending Checklist rows: {e}")
 
     return (updated, appended)
 
-def get_parade_records(selected_company: str, _sheet_parade):
+def _load_parade_records(selected_company: str, all_values: List[List[str]]):
     """
-    Returns all rows from Parade_State as a list of dicts, including row numbers.
+    Returns all rows from Parade_State (its get_all_values(), header row first) as a list of dicts, including row numbers.
     Only includes statuses where End_Date is today or in the future.
     Uses 'name' to identify the individual (instead of '4d_number').
     Includes the 'company' field in each record.
     """
     today = datetime.today().date()
-    all_values = _sheet_parade.get_all_values()  # includes header row at index 0
+    today_key = today.strftime("%Y%m%d")
     if not all_values or len(all_values) < 2:
         logger.warning(f"No records found in Parade_State for company '{selected_company}'.")
         return []
     
     header = [h.strip().lower() for h in all_values[0]]
+    end_idx = header.index('end_date_ddmmyyyy') if 'end_date_ddmmyyyy' in header else None
     records = []
     for idx, row in enumerate(all_values[1:], start=2):  # Start at row 2 in Google Sheets
         if len(row) < len(header):
             logger.warning(f"Skipping malformed row {idx} in Parade_State.")
             continue
 
+        # Most Parade_State rows are expired statuses; drop them on the raw cell
+        # before paying for the per-field normalization below. A plain DDMMYYYY cell is
+        # compared as a YYYYMMDD string so expired rows never build a datetime at all.
+        raw_end = row[end_idx] if end_idx is not None else ''
+        if len(raw_end) == 8 and raw_end.isdigit() and raw_end[4:] + raw_end[2:4] + raw_end[:2] < today_key:
+            continue
+        # This is the only parse of the end date
+        end_dt = _fast_date(raw_end) if end_idx is not None else None
+        if end_dt is not None and end_dt.date() < today:
+            continue
+
         record = dict(zip(header, row))
         
-        # Use Name
-        record['name'] = ensure_str(record.get('name', ''))
-        record['platoon'] = ensure_str(record.get('platoon', ''))
-        record['4d_number'] = ensure_str(record.get('4d_number', ''))  # We'll keep it for any leaves logic
+        # Use Name; 4d_number is kept for any leaves logic
+        for key in _PARADE_TEXT_FIELDS:
+            record[key] = record.get(key, '').strip()
+        record['_platoon_norm'] = normalize_name(record['platoon'])
         record['start_date_ddmmyyyy'] = ensure_date_str(record.get('start_date_ddmmyyyy', ''))
         record['end_date_ddmmyyyy'] = ensure_date_str(record.get('end_date_ddmmyyyy', ''))
-        record['status'] = ensure_str(record.get('status', ''))
         record['company'] = selected_company  # Add company information
 
-        try:
-            ed = datetime.strptime(record['end_date_ddmmyyyy'], "%d%m%Y").date()
-            if ed >= today:
-                record['_row_num'] = idx
-                records.append(record)
-        except ValueError:
+        if end_dt is None:
             logger.warning(
                 f"Invalid date format in Parade_State for {record.get('name', '')}: "
                 f"{record.get('end_date_ddmmyyyy', '')}"
             )
             continue
 
+        record['_row_num'] = idx
+        # Keep the parsed dates on the record so consumers don't re-parse them
+        sd = _fast_date(record['start_date_ddmmyyyy'])
+        record['_start_dt'] = sd.date() if sd else None
+        record['_end_dt'] = end_dt.date()
+        records.append(record)
+
     return records
-def get_allparade_records(selected_company: str, _sheet_parade):
+def _load_allparade_records(selected_company: str, all_values: List[List[str]]):
     """
-    Returns all rows from Parade_State as a list of dicts, including row numbers.
+    Returns all rows from Parade_State (its get_all_values(), header row first) as a list of dicts, including row numbers.
     Only includes statuses where End_Date is today or in the future.
     Uses 'name' to identify the individual (instead of '4d_number').
     Includes the 'company' field in each record.
     """
     today = datetime.today().date()
-    all_values = _sheet_parade.get_all_values()  # includes header row at index 0
     if not all_values or len(all_values) < 2:
         logger.warning(f"No records found in Parade_State for company '{selected_company}'.")
         return []
@@ -1223,67 +1344,273 @@ def get_allparade_records(selected_company: str, _sheet_parade):
 
         record = dict(zip(header, row))
         
-        # Use Name
-        record['name'] = ensure_str(record.get('name', ''))
-        record['platoon'] = ensure_str(record.get('platoon', ''))
-        record['4d_number'] = ensure_str(record.get('4d_number', ''))  # We'll keep it for any leaves logic
+        # Use Name; 4d_number is kept for any leaves logic
+        for key in _PARADE_TEXT_FIELDS:
+            record[key] = record.get(key, '').strip()
+        record['_platoon_norm'] = normalize_name(record['platoon'])
         record['start_date_ddmmyyyy'] = ensure_date_str(record.get('start_date_ddmmyyyy', ''))
         record['end_date_ddmmyyyy'] = ensure_date_str(record.get('end_date_ddmmyyyy', ''))
-        record['status'] = ensure_str(record.get('status', ''))
         record['company'] = selected_company  # Add company information
 
-        try:
-            ed = datetime.strptime(record['end_date_ddmmyyyy'], "%d%m%Y").date()
-            if ed:
-                record['_row_num'] = idx
-                records.append(record)
-        except ValueError:
+        end_dt = _fast_date(record['end_date_ddmmyyyy'])
+        if end_dt is None:
             logger.warning(
                 f"Invalid date format in Parade_State for {record.get('name', '')}: "
                 f"{record.get('end_date_ddmmyyyy', '')}"
             )
             continue
 
+        record['_row_num'] = idx
+        # Keep the parsed dates on the record so consumers don't re-parse them
+        sd = _fast_date(record['start_date_ddmmyyyy'])
+        record['_start_dt'] = sd.date() if sd else None
+        record['_end_dt'] = end_dt.date()
+        records.append(record)
+
     return records
 
-def get_conduct_records(selected_company: str, _sheet_conducts):
+# Conducts columns that are normalized on load, with the value used when the column is absent
+_CONDUCT_TEXT_FIELDS = (
+    ('conduct_name', ''),
+    ('p/t plt1', '0/0'),
+    ('p/t plt2', '0/0'),
+    ('p/t plt3', '0/0'),
+    ('p/t plt4', '0/0'),
+    ('p/t total', '0/0'),
+    ('plt1 outliers', ''),
+    ('plt2 outliers', ''),
+    ('plt3 outliers', ''),
+    ('plt4 outliers', ''),
+    ('coy hq outliers', ''),
+    ('pointers', ''),
+    ('submitted_by', ''),
+)
+
+def _load_conduct_records(selected_company: str, all_values: List[List[str]]):
     """
-    Returns all rows from Conducts as a list of dicts.
+    Returns all rows from Conducts (its get_all_values(), header row first) as a list of dicts.
     """
-    records = _sheet_conducts.get_all_records()
-    if not records:
+    if not all_values or len(all_values) < 2:
         logger.warning(f"No records found in Conducts for company '{selected_company}'.")
         return []
 
+    header = [h.strip().lower() for h in all_values[0]]
+    width = len(header)
     normalized_records = []
-    for row in records:
-        normalized_row = {k.strip().lower(): v for k, v in row.items()}
+    for idx, row in enumerate(all_values[1:], start=2):  # Start at row 2 in Google Sheets
+        # Pad short rows so missing trailing cells read as blank
+        normalized_row = dict(zip(header, row + [''] * (width - len(row))))
+        normalized_row['_row_num'] = idx
         normalized_row['date'] = ensure_date_str(normalized_row.get('date', ''))
-        normalized_row['conduct_name'] = ensure_str(normalized_row.get('conduct_name', ''))
-        normalized_row['p/t plt1'] = ensure_str(normalized_row.get('p/t plt1', '0/0'))
-        normalized_row['p/t plt2'] = ensure_str(normalized_row.get('p/t plt2', '0/0'))
-        normalized_row['p/t plt3'] = ensure_str(normalized_row.get('p/t plt3', '0/0'))
-        normalized_row['p/t plt4'] = ensure_str(normalized_row.get('p/t plt4', '0/0'))
-        normalized_row['p/t total'] = ensure_str(normalized_row.get('p/t total', '0/0'))
-        normalized_row['plt1 outliers'] = ensure_str(normalized_row.get('plt1 outliers', ''))
-        normalized_row['plt2 outliers'] = ensure_str(normalized_row.get('plt2 outliers', ''))
-        normalized_row['plt3 outliers'] = ensure_str(normalized_row.get('plt3 outliers', ''))
-        normalized_row['plt4 outliers'] = ensure_str(normalized_row.get('plt4 outliers', ''))
-        normalized_row['coy hq outliers'] = ensure_str(normalized_row.get('coy hq outliers', ''))
-        normalized_row['pointers'] = ensure_str(normalized_row.get('pointers', ''))
-        normalized_row['submitted_by'] = ensure_str(normalized_row.get('submitted_by', ''))
+        # get_all_values() only yields strings, so stripping is all the coercion these need
+        for key, default in _CONDUCT_TEXT_FIELDS:
+            normalized_row[key] = normalized_row.get(key, default).strip()
         normalized_records.append(normalized_row)
     
     return normalized_records
 
-def get_company_strength(platoon: str, records_nominal):
+# Loaded records are shared across all sessions for this many seconds
+RECORDS_CACHE_TTL = 300
+
+@st.cache_resource
+def _get_records_cache() -> Dict:
     """
-    Count how many rows in Nominal_Roll belong to that platoon.
+    Process-wide {key: (loaded_at, value)} store holding raw sheet values and the
+    records parsed from them. Held in cache_resource so every session reuses the same sheet reads.
     """
-    return sum(
-        1 for row in records_nominal
-        if normalize_name(row.get('platoon', '')) == normalize_name(platoon)
-    )
+    return {}
+
+def _values_entry_is_fresh(entry, now: float) -> bool:
+    """True if a cached (loaded_at, value) entry exists and is younger than RECORDS_CACHE_TTL."""
+    return entry is not None and now - entry[0] < RECORDS_CACHE_TTL
+
+def _sheet_values_entry(selected_company: str, _sheet):
+    """
+    Return the shared (loaded_at, get_all_values()) entry for a worksheet, re-reading it once the TTL lapses.
+    """
+    cache = _get_records_cache()
+    key = ("values", selected_company, _sheet.id)
+    now = time.monotonic()
+    entry = cache.get(key)
+    if not _values_entry_is_fresh(entry, now):
+        entry = (now, _sheet.get_all_values())
+        cache[key] = entry
+    return entry
+
+def prefetch_sheet_values(selected_company: str, sheets):
+    """
+    Read every worksheet in `sheets` whose cached values are missing or stale with a single
+    values_batch_get round-trip, instead of one get_all_values() request per worksheet.
+    On failure the sheets are simply left to load individually.
+    """
+    cache = _get_records_cache()
+    now = time.monotonic()
+    stale = [
+        ws for ws in sheets
+        if ws is not None and not _values_entry_is_fresh(cache.get(("values", selected_company, ws.id)), now)
+    ]
+    if len(stale) < 2:
+        return
+    try:
+        response = stale[0].spreadsheet.values_batch_get(
+            [gspread.utils.absolute_range_name(ws.title) for ws in stale]
+        )
+    except Exception as e:
+        logger.warning(f"Batch read failed for company '{selected_company}', reading sheets individually: {e}")
+        return
+    for ws, value_range in zip(stale, response.get("valueRanges", [])):
+        # Pad ragged rows the same way get_all_values() does
+        cache[("values", selected_company, ws.id)] = (now, gspread.utils.fill_gaps(value_range.get("values", [[]])))
+
+def _cached_records(kind: str, selected_company: str, _sheet, loader) -> List[Dict]:
+    """
+    Records for (kind, company, worksheet), parsed by `loader` once per read of the sheet's values.
+    Callers get their own dict copies since the cached list is shared between sessions.
+    """
+    cache = _get_records_cache()
+    loaded_at, values = _sheet_values_entry(selected_company, _sheet)
+    key = (kind, selected_company, _sheet.id)
+    entry = cache.get(key)
+    if entry is None or entry[0] != loaded_at:
+        entry = (loaded_at, loader(selected_company, values))
+        cache[key] = entry
+    return [dict(record) for record in entry[1]]
+
+def clear_all_caches():
+    """Drop every cached record list; call after writing to any of the cached sheets."""
+    _get_records_cache().clear()
+
+def clear_sheet_caches(selected_company: str, *sheets):
+    """
+    Drop the cached values and records of just these worksheets; call after writing to them
+    so other sheets (and other companies) keep their cached reads.
+    """
+    sheet_ids = {ws.id for ws in sheets}
+    cache = _get_records_cache()
+    for key in list(cache):
+        if key[1] == selected_company and key[2] in sheet_ids:
+            cache.pop(key, None)
+
+def get_nominal_records(selected_company: str, _sheet_nominal):
+    """Cached Nominal_Roll records; see _load_nominal_records."""
+    return _cached_records("nominal", selected_company, _sheet_nominal, _load_nominal_records)
+
+def get_nominal_name_keys(selected_company: str, _sheet_nominal) -> frozenset:
+    """
+    Cached frozenset of uppercase Nominal_Roll names, rebuilt only when the sheet's values are re-read
+    rather than on every submit.
+    """
+    cache = _get_records_cache()
+    loaded_at, _ = _sheet_values_entry(selected_company, _sheet_nominal)
+    key = ("nominal_names", selected_company, _sheet_nominal.id)
+    entry = cache.get(key)
+    if entry is None or entry[0] != loaded_at:
+        records = get_nominal_records(selected_company, _sheet_nominal)
+        entry = (loaded_at, frozenset(record['name'].upper() for record in records))
+        cache[key] = entry
+    return entry[1]
+
+def get_parade_records(selected_company: str, _sheet_parade):
+    """Cached current/upcoming Parade_State records; see _load_parade_records."""
+    return _cached_records("parade", selected_company, _sheet_parade, _load_parade_records)
+
+def get_allparade_records(selected_company: str, _sheet_parade):
+    """Cached Parade_State records; see _load_allparade_records."""
+    return _cached_records("allparade", selected_company, _sheet_parade, _load_allparade_records)
+
+def get_conduct_records(selected_company: str, _sheet_conducts):
+    """Cached Conducts records; see _load_conduct_records."""
+    return _cached_records("conducts", selected_company, _sheet_conducts, _load_conduct_records)
+
+def get_everything_values(selected_company: str, _sheet_everything) -> List[List[str]]:
+    """
+    Cached get_all_values() of the Everything sheet for read-only views.
+    Write paths must keep reading the sheet directly so column indices are current.
+    """
+    if not _sheet_everything:
+        return []
+    values = _sheet_values_entry(selected_company, _sheet_everything)[1]
+    return [list(row) for row in values]
+
+def get_platoon_strengths(records_nominal) -> Counter:
+    """
+    Count Nominal_Roll rows per normalized platoon in a single pass.
+    """
+    return Counter(row['_platoon_norm'] for row in records_nominal)
+
+def _platoon_rows_and_parades(platoon: str, records_nominal, records_parade):
+    """
+    Return the platoon's Nominal_Roll rows and {NAME (uppercase): [parade records]} for just those people.
+    The platoon filter runs first so only this platoon's statuses get indexed.
+    """
+    target = normalize_name(platoon)
+    platoon_rows = [row for row in records_nominal if row['_platoon_norm'] == target]
+    # Loaders strip 'name' on both sheets, so only the case needs folding here
+    platoon_names = {row['name'].upper() for row in platoon_rows}
+
+    parade_map = defaultdict(list)
+    for row in records_parade:
+        person_name = row['name'].upper()
+        if person_name in platoon_names:
+            parade_map[person_name].append(row)
+    return platoon_rows, parade_map
+
+@lru_cache(maxsize=1024)
+def _split_status_reason(status_raw: str):
+    """
+    Derive (status_cleaned, reason, others_reason) from a stored Parade_State status if it
+    includes RSI/RSO with an additional reason in brackets, e.g. "MC (RSI) (GE)" -> ("MC (RSI)", "GE", "").
+    Cached because the same few status strings recur across every platoon load.
+    """
+    reason_val = ''
+    others_reason_val = ''  # Custom reason when "Others" is selected
+    status_cleaned = status_raw
+    try:
+        # Capture all parenthetical groups, e.g. (RSI) (Dermatological)
+        groups = _PAREN_GROUP_RE.findall(status_raw) if '(' in status_raw else []
+        if groups:
+            # Filter out RSI/RSO markers
+            non_rsi_rso = [g.strip() for g in groups if g.strip().upper() not in ['RSI', 'RSO']]
+            if non_rsi_rso:
+                # Check if "Others" is in the groups
+                others_index = -1
+                for i, g in enumerate(non_rsi_rso):
+                    if g.lower() == "others":
+                        others_index = i
+                        reason_val = "Others"
+                        break
+                
+                # If "Others" found, check if there's a custom reason after it
+                if others_index >= 0:
+                    # If there's a group after "Others", that's the custom reason
+                    if others_index < len(non_rsi_rso) - 1:
+                        others_reason_val = non_rsi_rso[-1]
+                    # Also check if "Others" itself contains custom text (e.g., "Others - Custom reason")
+                    elif len(non_rsi_rso[others_index]) > 6:
+                        parts = _OTHERS_REASON_SPLIT_RE.split(non_rsi_rso[others_index], 1)
+                        if len(parts) > 1:
+                            others_reason_val = parts[1].strip()
+                else:
+                    # No "Others" found, try to match the last group
+                    g_last = non_rsi_rso[-1]
+                    # Map to canonical casing from dropdown options; if not matched, keep as-is
+                    reason_val = _RSI_RSO_REASONS_BY_LOWER.get(g_last.lower(), g_last)
+                
+                # Remove the reason from status, keep only RSI/RSO markers
+                # e.g. "MC (RSI) (GE)" -> "MC (RSI)"
+                # For "Others", remove "Others" itself but keep custom reason if it was separate
+                for reason_group in non_rsi_rso:
+                    # Don't remove the custom reason if it's separate from "Others"
+                    if reason_val.lower() == "others" and others_reason_val and reason_group == others_reason_val:
+                        continue
+                    # Remove "Others" and other standard reasons
+                    if reason_group.lower() != "others" or not others_reason_val:
+                        status_cleaned = status_cleaned.replace(f"({reason_group})", "").strip()
+    except Exception:
+        # On any parsing error, leave reason empty
+        reason_val = ''
+        others_reason_val = ''
+    return status_cleaned, reason_val, others_reason_val
 
 def get_company_personnel(platoon: str, records_nominal, records_parade):
     """
@@ -1291,91 +1618,23 @@ def get_company_personnel(platoon: str, records_nominal, records_parade):
     followed by all nominal rows without statuses. 
     Matches by 'name' (uppercase) instead of '4d_number'.
     """
-    from collections import defaultdict
-    parade_map = defaultdict(list)
-    for row in records_parade:
-        person_name = row.get('name', '').strip().upper()
-        parade_map[person_name].append(row)
+    platoon_rows, parade_map = _platoon_rows_and_parades(platoon, records_nominal, records_parade)
     
     data_with_status = []
     data_nominal = []
     
-    for row in records_nominal:
-        p = row.get('platoon', '')
-        if normalize_name(p) != normalize_name(platoon):
-            continue
-
-        rank = row.get('rank', '')
-        original_name = row.get('name', '')
-        four_d = row.get('4d_number', '')
+    for row in platoon_rows:
+        rank = row['rank']
+        original_name = row['name']
+        four_d = row['4d_number']
 
-        name_key = original_name.strip().upper()
+        name_key = original_name.upper()
 
         # Retrieve all parade statuses for the person (by name)
         person_parades = parade_map.get(name_key, [])
         for parade in person_parades:
             # Derive Reason from existing status if it includes RSI/RSO with an additional reason in brackets
-            status_raw = ensure_str(parade.get('status', ''))
-            reason_val = ''
-            others_reason_val = ''  # Custom reason when "Others" is selected
-            status_cleaned = status_raw
-            try:
-                import re
-                # Capture all parenthetical groups, e.g. (RSI) (Dermatological)
-                groups = re.findall(r"\(([^)]*)\)", status_raw)
-                if groups:
-                    # Filter out RSI/RSO markers
-                    non_rsi_rso = [g.strip() for g in groups if g.strip().upper() not in ['RSI', 'RSO']]
-                    if non_rsi_rso:
-                        # Map to canonical casing from dropdown options
-                        allowed = [
-                            "Musculoskeletal", "Psychological", "Dermatological",
-                            "Headache", "URTI", "GE", "Others"
-                        ]
-                        
-                        # Check if "Others" is in the groups
-                        others_index = -1
-                        for i, g in enumerate(non_rsi_rso):
-                            if g.lower() == "others":
-                                others_index = i
-                                reason_val = "Others"
-                                break
-                        
-                        # If "Others" found, check if there's a custom reason after it
-                        if others_index >= 0:
-                            # If there's a group after "Others", that's the custom reason
-                            if others_index < len(non_rsi_rso) - 1:
-                                others_reason_val = non_rsi_rso[-1]
-                            # Also check if "Others" itself contains custom text (e.g., "Others - Custom reason")
-                            elif len(non_rsi_rso[others_index]) > 6:
-                                parts = re.split(r'[-:]', non_rsi_rso[others_index], 1)
-                                if len(parts) > 1:
-                                    others_reason_val = parts[1].strip()
-                        else:
-                            # No "Others" found, try to match the last group
-                            g_last = non_rsi_rso[-1]
-                            for opt in allowed:
-                                if g_last.lower() == opt.lower():
-                                    reason_val = opt
-                                    break
-                            if not reason_val:
-                                # If not matched, keep as-is
-                                reason_val = g_last
-                        
-                        # Remove the reason from status, keep only RSI/RSO markers
-                        # e.g. "MC (RSI) (GE)" -> "MC (RSI)"
-                        # For "Others", remove "Others" itself but keep custom reason if it was separate
-                        for reason_group in non_rsi_rso:
-                            # Don't remove the custom reason if it's separate from "Others"
-                            if reason_val.lower() == "others" and others_reason_val and reason_group == others_reason_val:
-                                continue
-                            # Remove "Others" and other standard reasons
-                            if reason_group.lower() != "others" or not others_reason_val:
-                                status_cleaned = status_cleaned.replace(f"({reason_group})", "").strip()
-            except Exception:
-                # On any parsing error, leave reason empty
-                reason_val = ''
-                others_reason_val = ''
+            status_cleaned, reason_val, others_reason_val = _split_status_reason(parade['status'])
             data_with_status.append({
                 'Rank': rank,
                 'Name': original_name,
@@ -1407,105 +1666,47 @@ def get_company_personnel(platoon: str, records_nominal, records_parade):
 def find_name_by_4d(four_d: str, records_nominal) -> str:
     """
     If you want to look up person's Name from Nominal_Roll given a 4D_Number.
+    Nominal_Roll 4D numbers are canonicalized at load, so only the argument is normalized.
     """
-    four_d = ensure_str(four_d).upper()
+    four_d = is_valid_4d(four_d)
+    if not four_d:
+        return ""
     for row in records_nominal:
-        if ensure_str(row.get("4d_number", "")).upper() == four_d:
-            return ensure_str(row.get("name", ""))
+        if row['4d_number'] == four_d:
+            return row['name']
     return ""
 
-def build_onstatus_table(platoon: str, date_obj: datetime, records_nominal, records_parade):
-    """
-    Return a list of dicts for everyone on status for that date + platoon.
-    If multiple statuses exist for the same person, prioritize based on a small hierarchy.
-    """
-    status_priority = {'leave': 3, 'fever': 2, 'mc': 1}
-    out = {}
-    parade_map = defaultdict(list)
-    for row in records_parade:
-        person_name = row.get('name', '').strip().upper()
-        parade_map[person_name].append(row)
-    
-    for row in records_nominal:
-        p = row.get('platoon', '')
-        if normalize_name(p) != normalize_name(platoon):
-            continue
-        name = row.get('name', '')
-        rank = row.get('rank', '')
-        four_d = row.get('4d_number', '')
-        name_key = name.strip().upper()
-
-        for parade in parade_map.get(name_key, []):
-            try:
-                start_dt = datetime.strptime(parade.get('start_date_ddmmyyyy', '01012000'), "%d%m%Y").date()
-                end_dt = datetime.strptime(parade.get('end_date_ddmmyyyy', '01012000'), "%d%m%Y").date()
-                if start_dt <= date_obj.date() <= end_dt:
-                    status = ensure_str(parade.get('status', '')).lower()
-                    if status in status_priority:
-                        if name_key in out:
-                            existing_status = out[name_key]['StatusDesc'].lower()
-                            if status_priority.get(status, 0) > status_priority.get(existing_status, 0):
-                                out[name_key] = {
-                                    "Rank": rank,
-                                    "Name": name,
-                                    "4D_Number": four_d,
-                                    "StatusDesc": ensure_str(parade.get('status', '')),
-                                    "Is_Outlier": True
-                                }
-                        else:
-                            out[name_key] = {
-                                "Rank": rank,
-                                "Name": name,
-                                "4D_Number": four_d,
-                                "StatusDesc": ensure_str(parade.get('status', '')),
-                                "Is_Outlier": True
-                            }
-            except ValueError:
-                logger.warning(
-                    f"Invalid date format for {name_key}: "
-                    f"{parade.get('start_date_ddmmyyyy', '')} - {parade.get('end_date_ddmmyyyy', '')}"
-                )
-                continue
-    logger.info(f"Built on-status table with {len(out)} entries for platoon {platoon} on {date_obj.strftime('%d%m%Y')}.")
-    return list(out.values())
-
 def build_conduct_table(platoon: str, date_obj: datetime, records_nominal, records_parade):
     """
     Return a list of dicts for all personnel in the platoon.
     'Attendance_Status' can be "Yes", "No", or "N/A" - default is "No" if person has active status, "Yes" if not.
     """
-    parade_map = defaultdict(list)
-    for row in records_parade:
-        person_name = row.get('name', '').strip().upper()
-        parade_map[person_name].append(row)
+    platoon_rows, parade_map = _platoon_rows_and_parades(platoon, records_nominal, records_parade)
+    target_date = date_obj.date()
     
     data = []
-    for person in records_nominal:
-        p = person.get('platoon', '')
-        if normalize_name(p) != normalize_name(platoon):
-            continue
-        name = person.get('name', '')
-        rank = person.get('rank', '')
-        four_d = person.get('4d_number', '')
-        name_key = name.strip().upper()
+    for person in platoon_rows:
+        name = person['name']
+        rank = person['rank']
+        four_d = person['4d_number']
+        name_key = name.upper()
 
         active_statuses = []  # List to hold all active statuses for the person
         
 
         for parade in parade_map.get(name_key, []):
-            try:
-                start_dt = datetime.strptime(parade.get('start_date_ddmmyyyy', ''), "%d%m%Y").date()
-                end_dt = datetime.strptime(parade.get('end_date_ddmmyyyy', ''), "%d%m%Y").date()
-                if start_dt <= date_obj.date() <= end_dt:
-                    status = parade.get('status', '').strip().upper()
-                    if status:  # Ensure status is not empty
-                        active_statuses.append(status)
-            except ValueError:
+            start_dt = parade['_start_dt']
+            end_dt = parade['_end_dt']
+            if start_dt is None or end_dt is None:
                 logger.warning(
                     f"Invalid date format for {name_key}: "
-                    f"{parade.get('start_date_ddmmyyyy', '')} - {parade.get('end_date_ddmmyyyy', '')}"
+                    f"{parade['start_date_ddmmyyyy']} - {parade['end_date_ddmmyyyy']}"
                 )
                 continue
+            if start_dt <= target_date <= end_dt:
+                status = parade['status'].upper()  # already stripped on load
+                if status:  # Ensure status is not empty
+                    active_statuses.append(status)
         has_active_status = len(active_statuses) > 0
         status_desc = ", ".join(active_statuses) if has_active_status else ""
         attendance_status = "No" if has_active_status else "Yes"
@@ -1527,22 +1728,16 @@ def build_conduct_table(platoon: str, date_obj: datetime, records_nominal, recor
 def build_fake_conduct_table(platoon: str, date_obj: datetime, records_nominal, records_parade):
     """
     Return a list of dicts for all personnel in the platoon.
-    'Attendance_Status' defaults to "Yes" for fake table (used in updates).
+    'Attendance_Status' defaults to "Yes" for fake table (used in updates), so parade statuses aren't indexed.
     """
-    parade_map = defaultdict(list)
-    for row in records_parade:
-        person_name = row.get('name', '').strip().upper()
-        parade_map[person_name].append(row)
-    
     data = []
+    target = normalize_name(platoon)
     for person in records_nominal:
-        p = person.get('platoon', '')
-        if normalize_name(p) != normalize_name(platoon):
+        if person['_platoon_norm'] != target:
             continue
-        name = person.get('name', '')
-        rank = person.get('rank', '')
-        four_d = person.get('4d_number', '')
-        name_key = name.strip().upper()
+        name = person['name']
+        rank = person['rank']
+        four_d = person['4d_number']
 
         # For fake table, we don't check active statuses - just default to "Yes"
         attendance_status = "Yes"
@@ -1575,6 +1770,14 @@ selected_company = st.sidebar.selectbox(
     options=st.session_state.user_companies
 )
 
+# Sheet reads are served from the shared cache for RECORDS_CACHE_TTL seconds; let users
+# pick up edits made directly in Google Sheets without waiting for it to lapse
+st.sidebar.button(
+    "Refresh Data",
+    on_click=clear_all_caches,
+    help="Reload the latest data from Google Sheets."
+)
+
 # Handle special case for Battalion-only users
 if selected_company == "Battalion":
     # Battalion users don't need individual company spreadsheets
@@ -1593,45 +1796,32 @@ else:
     SHEET_CONDUCTS = worksheets["conducts"]
     SHEET_CHECKLIST = worksheets["checklist"]
 
-if "conduct_date" not in st.session_state:
-    st.session_state.conduct_date = ""
-if "conduct_platoon" not in st.session_state:
-    st.session_state.conduct_platoon = 1
-if "conduct_name" not in st.session_state:
-    st.session_state.conduct_name = ""
-if "conduct_table" not in st.session_state:
-    st.session_state.conduct_table = []
-if "conduct_pointers_observation" not in st.session_state:
-    st.session_state.conduct_pointers_observation = ""
-if "conduct_pointers_reflection" not in st.session_state:
-    st.session_state.conduct_pointers_reflection = ""
-if "conduct_pointers_recommendation" not in st.session_state:
-    st.session_state.conduct_pointers_recommendation = ""
-
-if "parade_platoon" not in st.session_state:
-    st.session_state.parade_platoon = 1
-if "parade_table" not in st.session_state:
-    st.session_state.parade_table = []
-
-if "update_conduct_selected" not in st.session_state:
-    st.session_state.update_conduct_selected = None
-if "update_conduct_platoon" not in st.session_state:
-    st.session_state.update_conduct_platoon = 1
-if "update_conduct_pointers_observation" not in st.session_state:
-    st.session_state.update_conduct_pointers_observation = ""
-if "update_conduct_pointers_reflection" not in st.session_state:
-    st.session_state.update_conduct_pointers_reflection = ""
-if "update_conduct_pointers_recommendation" not in st.session_state:
-    st.session_state.update_conduct_pointers_recommendation = ""
-if "update_conduct_table" not in st.session_state:
-    st.session_state.update_conduct_table = []
-
-if "adhoc_personnel" not in st.session_state:
-    st.session_state.adhoc_personnel = []
-if "adhoc_conduct_name" not in st.session_state:
-    st.session_state.adhoc_conduct_name = ""
-if "adhoc_conduct_date" not in st.session_state:
-    st.session_state.adhoc_conduct_date = ""
+# Per-session defaults for the feature pages; setdefault leaves existing values alone
+SESSION_DEFAULTS = {
+    "conduct_date": "",
+    "conduct_platoon": 1,
+    "conduct_name": "",
+    "conduct_table": [],
+    "conduct_pointers_observation": "",
+    "conduct_pointers_reflection": "",
+    "conduct_pointers_recommendation": "",
+
+    "parade_platoon": 1,
+    "parade_table": [],
+
+    "update_conduct_selected": None,
+    "update_conduct_platoon": 1,
+    "update_conduct_pointers_observation": "",
+    "update_conduct_pointers_reflection": "",
+    "update_conduct_pointers_recommendation": "",
+    "update_conduct_table": [],
+
+    "adhoc_personnel": [],
+    "adhoc_conduct_name": "",
+    "adhoc_conduct_date": "",
+}
+for key, default in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, default)
 
 # Determine available features based on user access
 if selected_company == "Battalion":
@@ -1662,6 +1852,16 @@ if selected_company == "Battalion" and feature != "Message":
     st.info("Please contact your administrator if you need access to company-specific features.")
     st.stop()
 
+if worksheets:
+    # Pull the core sheets, plus Everything for the pages that read it, in one request;
+    # the record getters then parse from the cache instead of fetching one sheet at a time
+    prefetch_sheets = [SHEET_NOMINAL, SHEET_PARADE, SHEET_CONDUCTS]
+    if feature in ("Update Conduct", "Analytics", "Checklist"):
+        prefetch_sheets.append(worksheets["everything"])
+    if feature == "Checklist":
+        prefetch_sheets.append(SHEET_CHECKLIST)
+    prefetch_sheet_values(selected_company, prefetch_sheets)
+
 if feature == "Add Conduct":
     st.header("Add Conduct")
     st.info("""Please key in name of conduct in all caps and properly with reference to training programme and choose the session number accurately!!
@@ -1749,7 +1949,7 @@ Examples:
             st.stop()
 
         try:
-            date_obj = datetime.strptime(date_str, "%d%m%Y")
+            date_obj = _parse_ddmmyyyy(date_str)
         except ValueError:
             st.error("Invalid date format (use DDMMYYYY).")
             st.stop()
@@ -1768,8 +1968,6 @@ Examples:
 
     if st.session_state.conduct_table:
         st.write("Select attendance status: 'Yes' = attended, 'No' = absent, 'N/A' = not applicable")
-        sorted_conduct_table = sorted(st.session_state.conduct_table, 
-                                 key=lambda x: "ZZZ" if x.get("Rank", "").upper() in NON_CMD_RANKS else x.get("Rank", ""))
         edited_data = st.data_editor(
             st.session_state.conduct_table,
             use_container_width=True,
@@ -1811,7 +2009,7 @@ Examples:
             st.stop()
 
         try:
-            datetime.strptime(date_str, "%d%m%Y")
+            _parse_ddmmyyyy(date_str)
         except ValueError:
             st.error("Invalid date format.")
             st.stop()
@@ -1836,16 +2034,26 @@ Examples:
         records_nominal = get_nominal_records(selected_company, SHEET_NOMINAL)
         records_parade = get_allparade_records(selected_company, SHEET_PARADE)
 
-        existing_4ds = {row.get("4d_number", "").strip().upper() for row in records_nominal}
+        # Nominal names are hashed once per sheet read so the new-person check below is O(1) per row
+        existing_names = get_nominal_name_keys(selected_company, SHEET_NOMINAL)
+        added_names = set()
         new_people = []
         all_outliers = []
-        four_d_to_name = {row['4d_number']: row['name'] for row in records_nominal}
+        # Participating non-cmd/cmd for this platoon, counted in the same pass as the outliers
+        # (only "Yes" status counts as participating, including rows skipped below)
+        non_cmd_part_count = 0
+        cmd_part_count = 0
 
         for row in edited_data:
             four_d = is_valid_4d(row.get("4D_Number", ""))
             name_ = ensure_str(row.get("Name", ""))
             rank_ = ensure_str(row.get("Rank", ""))
             attendance_status = row.get("Attendance_Status", "No")
+            if attendance_status == "Yes":
+                if row.get('Rank', '').upper() in NON_CMD_RANKS:
+                    non_cmd_part_count += 1
+                else:
+                    cmd_part_count += 1
             status_desc = ensure_str(row.get("StatusDesc", ""))
 
             # If both 4D and Name are missing, skip
@@ -1854,79 +2062,71 @@ Examples:
                 continue
 
             # If person is new (by Name), add to nominal if not found
-            if name_ and all(n_.get("name", "").strip().upper() != name_.strip().upper() for n_ in records_nominal):
+            name_key = name_.strip().upper()
+            if name_ and name_key not in existing_names and name_key not in added_names:
                 if not rank_:
                     st.error(f"Rank is required for new Name '{name_}'. Skipping.")
                     logger.error(f"Rank missing for new Name: {name_}.")
                     continue
                 new_people.append((rank_, name_, four_d, platoon))
-                logger.info(
-                    f"Adding new person: Rank={rank_}, Name={name_}, 4D_Number={four_d}, "
-                    f"Platoon={platoon} in company '{selected_company}' by user '{submitted_by}'."
-                )
-
-            if attendance_status in ["No", "N/A"]:
-                if attendance_status == "N/A":
-                    # For N/A, always show (N/A) even if no other status description
-                    combined_status = f"N/A{', ' + status_desc if status_desc else ''}"
-                    all_outliers.append(f"{four_d} {name_} ({combined_status})" if four_d else f"{name_} ({combined_status})")
-                elif status_desc:
-                    all_outliers.append(f"{four_d} {name_} ({status_desc})" if four_d else f"{name_} ({status_desc})")
-                else:
-                    all_outliers.append(f"{four_d} {name_}" if four_d else f"{name_}")
-
-        for (rank, nm, fd, p_) in new_people:
-            final_fd = fd if fd else ""
-            SHEET_NOMINAL.append_row([rank, nm, final_fd, p_, 14, ""])  
+                # Remember them so a repeated name later in this submit isn't added twice
+                added_names.add(name_key)
+
+            if attendance_status in ("No", "N/A"):
+                # For N/A, always show (N/A) even if no other status description
+                detail = f"N/A{', ' + status_desc if status_desc else ''}" if attendance_status == "N/A" else status_desc
+                base_name = f"{four_d} {name_}" if four_d else name_
+                all_outliers.append(f"{base_name} ({detail})" if detail else base_name)
+
+        if new_people:
+            # One append for everyone new instead of a request per person
+            SHEET_NOMINAL.append_rows(
+                [[rank, nm, fd if fd else "", p_, 14, ""] for (rank, nm, fd, p_) in new_people],
+                value_input_option='RAW'
+            )
             logger.info(
-                f"Added new person to Nominal_Roll: Rank={rank}, Name={nm}, 4D_Number={final_fd}, "
-                f"Platoon={p_} in company '{selected_company}' by user '{submitted_by}'."
+                f"Added {len(new_people)} new person(s) to Nominal_Roll for platoon {platoon} in company "
+                f"'{selected_company}' by user '{submitted_by}': "
+                + "; ".join(f"{rank} {nm} ({fd or 'no 4D'})" for (rank, nm, fd, p_) in new_people)
             )
+            clear_sheet_caches(selected_company, SHEET_NOMINAL)
 
-        total_strength_platoons = {}
-        # Updated to include 'Coy HQ'
-        for plt in platoon_options:
-            strength = get_company_strength(plt, records_nominal)
-            total_strength_platoons[plt] = strength
-            print(total_strength_platoons[plt])
+        # One pass over the roll counts every platoon, including 'Coy HQ'
+        platoon_strengths = get_platoon_strengths(records_nominal)
+        total_strength_platoons = {
+            plt: platoon_strengths[normalize_name(plt)] for plt in platoon_options
+        }
 
         # Initialize non-cmd and cmd counts for each platoon
         non_cmd_counts = {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "Coy HQ": 0}
         cmd_counts = {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "Coy HQ": 0}
-        non_cmd_totals = {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "Coy HQ": 0}
-        cmd_totals = {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "Coy HQ": 0}
-
-        # Calculate total non-cmd and cmd for each platoon
-        for person in records_nominal:
-            plt = person.get("platoon", "")
-            if plt in platoon_options:
-                if person.get("rank", "").upper() in NON_CMD_RANKS:
-                    non_cmd_totals[plt] += 1
-                else:
-                    cmd_totals[plt] += 1
 
-        # Count participating non-cmd and cmd (only "Yes" status counts as participating)
-        for row in edited_data:
-            if row.get('Attendance_Status', 'No') == "Yes":
-                plt = platoon
-                if plt in platoon_options:
-                    if row.get('Rank', '').upper() in NON_CMD_RANKS:
-                        non_cmd_counts[plt] += 1
-                    else:
-                        cmd_counts[plt] += 1
+        # Calculate total non-cmd and cmd for each platoon, counted by (platoon, is_non_cmd) in one pass
+        rank_counts = Counter(
+            (person.get("platoon", ""), person.get("rank", "").upper() in NON_CMD_RANKS)
+            for person in records_nominal
+        )
+        non_cmd_totals = {plt: rank_counts[(plt, True)] for plt in platoon_options}
+        cmd_totals = {plt: rank_counts[(plt, False)] for plt in platoon_options}
+
+        # Slot of the participating platoon in the PLT1..PLT5, Coy HQ columns (None if unknown)
+        platoon_idx = platoon_options.index(platoon) if platoon in platoon_options else None
+
+        # Participation was counted while walking edited_data above
+        if platoon_idx is not None:
+            non_cmd_counts[platoon] = non_cmd_part_count
+            cmd_counts[platoon] = cmd_part_count
 
         # Initialize pt_plts with detailed format for all platoons
         pt_plts = ['0/0\n0/0\n0/0'] * 6
 
         # Update the platoon that's participating in this conduct
-        if platoon in platoon_options:
-            index = platoon_options.index(platoon)
-            
+        if platoon_idx is not None:
             non_cmd_ratio = f"{non_cmd_counts[platoon]}/{non_cmd_totals[platoon]}"
             cmd_ratio = f"{cmd_counts[platoon]}/{cmd_totals[platoon]}"
             total_ratio = f"{non_cmd_counts[platoon] + cmd_counts[platoon]}/{total_strength_platoons[platoon]}"
             
-            pt_plts[index] = f"non-cmd: {non_cmd_ratio}\ncmd: {cmd_ratio}\nTOTAL: {total_ratio}"
+            pt_plts[platoon_idx] = f"non-cmd: {non_cmd_ratio}\ncmd: {cmd_ratio}\nTOTAL: {total_ratio}"
 
         # Calculate total participants and total strength
         total_non_cmd_part = sum(non_cmd_counts.values())
@@ -1942,9 +2142,8 @@ Examples:
         formatted_date_str = ensure_date_str(date_str)
         # Prepare outliers per platoon – order: PLT1, PLT2, PLT3, PLT4, PLT5, Coy HQ
         outliers_list = ["None"] * 6
-        if platoon in platoon_options:
-            index = platoon_options.index(platoon)
-            outliers_list[index] = ", ".join(all_outliers) if all_outliers else "None"
+        if platoon_idx is not None:
+            outliers_list[platoon_idx] = ", ".join(all_outliers) if all_outliers else "None"
 
         SHEET_CONDUCTS.append_row([
             formatted_date_str,  # Column 1: Date
@@ -1965,6 +2164,7 @@ Examples:
             pointers,            # Column 16: Pointers
             submitted_by         # Column 17: Submitted_By
         ])
+        clear_sheet_caches(selected_company, SHEET_CONDUCTS)
 
         logger.info(
             f"Appended Conduct: {formatted_date_str}, {cname}, "
@@ -1981,28 +2181,7 @@ Examples:
             cname,
             attendance_data
         )
-
-
-        try:
-            conduct_cell = SHEET_CONDUCTS.find(cname, in_column=2)
-            if conduct_cell:
-                conduct_row = conduct_cell.row
-            else:
-                st.error("Failed to locate the newly added conduct in the sheet.")
-                logger.error(f"Failed to locate the newly added conduct '{cname}' in the sheet.")
-                st.stop()
-        except Exception as e:
-            st.error(f"Error locating Conduct in the sheet: {e}")
-            logger.error(f"Exception while locating Conduct '{cname}': {e}")
-            st.stop()
-
-        try:
-            SHEET_CONDUCTS.update_cell(conduct_row, 9, pt_total)
-            logger.info(f"Updated P/T Total to {pt_total} for conduct '{cname}' in company '{selected_company}'.")
-        except Exception as e:
-            st.error(f"Error updating P/T Total: {e}")
-            logger.error(f"Exception while updating P/T Total for conduct '{cname}': {e}")
-            st.stop()
+        clear_sheet_caches(selected_company, SHEET_EVERYTHING)
 
         st.success(
             f"Conduct Finalized!\n\n"
@@ -2043,6 +2222,8 @@ elif feature == "Add Ad-Hoc Conduct":
 
     records_nominal = get_nominal_records(selected_company, SHEET_NOMINAL)
     personnel_options = sorted([p['name'] for p in records_nominal if p.get('name')])
+    # Set view for membership checks; personnel_options stays a sorted list for the widgets
+    personnel_option_set = set(personnel_options)
     
     # Predefined Groups
     st.subheader("📋 Load Predefined Group")
@@ -2111,7 +2292,7 @@ elif feature == "Add Ad-Hoc Conduct":
     # Filter predefined groups to only include personnel that exist in the current company
     available_groups = {}
     for group_name, members in predefined_groups.items():
-        valid_members = [name for name in members if name in personnel_options]
+        valid_members = [name for name in members if name in personnel_option_set]
         if valid_members:  # Only add if there are valid members
             available_groups[group_name] = valid_members
     
@@ -2171,7 +2352,7 @@ elif feature == "Add Ad-Hoc Conduct":
     platoon_to_members = {}
     for rec in records_nominal:
         name = rec.get('name')
-        if not name or name not in personnel_options:
+        if not name or name not in personnel_option_set:
             continue
         platoon_code = str(rec.get('platoon', '')).strip() or "Coy HQ"
         platoon_to_members.setdefault(platoon_code, []).append(name)
@@ -2281,7 +2462,7 @@ elif feature == "Add Ad-Hoc Conduct":
             st.error("Please enter a Date.")
             st.stop()
         try:
-            date_obj = datetime.strptime(date_str, "%d%m%Y")
+            date_obj = _parse_ddmmyyyy(date_str)
         except ValueError:
             st.error("Invalid date format (use DDMMYYYY).")
             st.stop()
@@ -2303,14 +2484,13 @@ elif feature == "Add Ad-Hoc Conduct":
 
             active_statuses = []
             for parade in parade_map.get(name.strip().upper(), []):
-                try:
-                    start_dt = datetime.strptime(parade.get('start_date_ddmmyyyy', ''), "%d%m%Y").date()
-                    end_dt = datetime.strptime(parade.get('end_date_ddmmyyyy', ''), "%d%m%Y").date()
-                    if start_dt <= date_obj.date() <= end_dt:
-                        status = parade.get('status', '').strip().upper()
-                        if status: active_statuses.append(status)
-                except ValueError:
+                start_dt = parade.get('_start_dt')
+                end_dt = parade.get('_end_dt')
+                if start_dt is None or end_dt is None:
                     continue
+                if start_dt <= date_obj.date() <= end_dt:
+                    status = parade.get('status', '').strip().upper()
+                    if status: active_statuses.append(status)
             
             has_active_status = len(active_statuses) > 0
             status_desc = ", ".join(active_statuses) if has_active_status else ""
@@ -2351,7 +2531,7 @@ elif feature == "Add Ad-Hoc Conduct":
             st.stop()
         
         try:
-            formatted_date = datetime.strptime(conduct_date, "%d%m%Y").strftime("%d%m%Y")
+            formatted_date = _parse_ddmmyyyy(conduct_date).strftime("%d%m%Y")
         except ValueError:
             st.error("Invalid date format. Please use DDMMYYYY.")
             st.stop()
@@ -2366,19 +2546,20 @@ elif feature == "Add Ad-Hoc Conduct":
             st.stop()
 
         new_col_index = len(all_everything_data[0]) + 1
-        SHEET_EVERYTHING.update_cell(1, new_col_index, new_col_header)
 
         participation_map = {row["Name"]: row["Attendance_Status"] for row in edited_data}
         
-        updates = []
-        for row_idx, row in enumerate(all_everything_data[1:], start=2):
-            name = row[2].strip()
-            value = participation_map.get(name, "")
-            cell = gspread.utils.rowcol_to_a1(row_idx, new_col_index)
-            updates.append({'range': cell, 'values': [[value]]})
-
-        if updates:
-            SHEET_EVERYTHING.batch_update(updates)
+        # Header and attendance values go out as one contiguous column write
+        column_values = [[new_col_header]]
+        for row in all_everything_data[1:]:
+            column_values.append([participation_map.get(row[2].strip(), "")])
+
+        column_range = (
+            f"{gspread.utils.rowcol_to_a1(1, new_col_index)}:"
+            f"{gspread.utils.rowcol_to_a1(len(column_values), new_col_index)}"
+        )
+        SHEET_EVERYTHING.batch_update([{'range': column_range, 'values': column_values}])
+        clear_sheet_caches(selected_company, SHEET_EVERYTHING)
 
         # Update 'Conducts' sheet (only "Yes" status counts as participating)
         non_cmd_part = sum(1 for p in edited_data if p["Attendance_Status"] == "Yes" and p["Rank"].upper() in NON_CMD_RANKS)
@@ -2419,6 +2600,7 @@ elif feature == "Add Ad-Hoc Conduct":
             outliers_list[0], outliers_list[1], outliers_list[2], outliers_list[3], outliers_list[4],
             outliers_list[5], "", st.session_state.username
         ])
+        clear_sheet_caches(selected_company, SHEET_CONDUCTS)
 
         st.success(f"Ad-Hoc Conduct '{conduct_name}' on {formatted_date} has been finalized.")
         logger.info(f"Ad-Hoc Conduct '{conduct_name}' added by user '{st.session_state.username}'.")
@@ -2430,7 +2612,14 @@ elif feature == "Update Conduct":
     st.header("Update Conduct")
 
     records_conducts = get_conduct_records(selected_company, SHEET_CONDUCTS)
-    conduct_names = [f"{row['date']} - {row['conduct_name']}" for row in records_conducts]
+    # Index records by their selectbox label so the selection resolves with one lookup
+    conduct_names = []
+    conducts_by_label = defaultdict(list)
+    for row in records_conducts:
+        label = f"{row['date']} - {row['conduct_name']}"
+        if label not in conducts_by_label:
+            conduct_names.append(label)
+        conducts_by_label[label].append(row)
     
     if not conduct_names:
         st.warning("No Conducts available to update.")
@@ -2446,18 +2635,12 @@ elif feature == "Update Conduct":
         st.error("Please select a conduct to update.")
         st.stop()
 
-    # Extract date and name from the selected conduct
+    # Find the exact matching record by both date and name
     try:
-        selected_parts = selected_conduct.split(" - ")
-        selected_date = selected_parts[0].strip()
-        selected_name = selected_parts[1].strip()
-        
-        # Find the exact matching record by both date and name
-        matching_records = [r for r in records_conducts 
-                          if r.get('date') == selected_date and r.get('conduct_name') == selected_name]
+        matching_records = conducts_by_label.get(selected_conduct, [])
         
         if not matching_records:
-            st.error(f"No conduct found with date '{selected_date}' and name '{selected_name}'")
+            st.error(f"No conduct found matching '{selected_conduct}'")
             logger.error(f"Conduct matching failed for '{selected_conduct}'")
             st.stop()
             
@@ -2519,9 +2702,9 @@ elif feature == "Update Conduct":
                 recommendation = ""
                 
                 # Extract Observation, Reflection, Recommendation using regex
-                obs_match = re.search(r'Observation\s*\d*:\s*([\s\S]*?)(?:\n|$)', entry, re.IGNORECASE)
-                refl_match = re.search(r'Reflection\s*\d*:\s*([\s\S]*?)(?:\n|$)', entry, re.IGNORECASE)
-                rec_match = re.search(r'Recommendation\s*\d*:\s*([\s\S]*?)(?:\n|$)', entry, re.IGNORECASE)
+                obs_match = _POINTER_OBS_RE.search(entry)
+                refl_match = _POINTER_REFL_RE.search(entry)
+                rec_match = _POINTER_REC_RE.search(entry)
                 
                 if obs_match:
                     observation = obs_match.group(1).strip()
@@ -2558,9 +2741,9 @@ elif feature == "Update Conduct":
                 recommendation = ""
                 
                 # Extract Observation, Reflection, Recommendation using regex
-                obs_match = re.search(r'Observation\s*\d*:\s*([\s\S]*?)(?:\n|$)', entry, re.IGNORECASE)
-                refl_match = re.search(r'Reflection\s*\d*:\s*([\s\S]*?)(?:\n|$)', entry, re.IGNORECASE)
-                rec_match = re.search(r'Recommendation\s*\d*:\s*([\s\S]*?)(?:\n|$)', entry, re.IGNORECASE)
+                obs_match = _POINTER_OBS_RE.search(entry)
+                refl_match = _POINTER_REFL_RE.search(entry)
+                rec_match = _POINTER_REC_RE.search(entry)
                 
                 if obs_match:
                     observation = obs_match.group(1).strip()
@@ -2610,7 +2793,7 @@ elif feature == "Update Conduct":
         platoon = str(st.session_state.conduct_platoon).strip()
         date_str = conduct_record['date']
         try:
-            date_obj = datetime.strptime(date_str, "%d%m%Y")
+            date_obj = _parse_ddmmyyyy(date_str)
         except ValueError:
             st.error("Invalid date format in selected Conduct.")
             st.stop()
@@ -2624,7 +2807,7 @@ elif feature == "Update Conduct":
         if is_adhoc_conduct_check:
             # Logic for loading Ad-Hoc conducts from the 'Everything' sheet
             st.info("Loading only the personnel involved in this ad-hoc conduct.")
-            everything_data = worksheets["everything"].get_all_values()
+            everything_data = get_everything_values(selected_company, worksheets["everything"])
             target_col_header = f"{conduct_record.get('date')}, {conduct_record.get('conduct_name')}"
             conduct_data = []
 
@@ -2633,12 +2816,14 @@ elif feature == "Update Conduct":
                 try:
                     col_idx = headers.index(target_col_header)
                     
-                    # Consolidate all outlier strings to parse their status descriptions
+                    # Parse each platoon's outlier column on its own so every column hits the
+                    # parse cache; a joined string is a fresh cache key on every rerun
                     outlier_keys = [f"plt{i} outliers" for i in range(1, 6)] + ["coy hq outliers"]
-                    all_outliers_str = ", ".join(
-                        [conduct_record.get(key, '') for key in outlier_keys if conduct_record.get(key, '').lower().strip() not in ('none', '')]
-                    )
-                    parsed_outliers = parse_existing_outliers(all_outliers_str)
+                    parsed_outliers = {}
+                    for key in outlier_keys:
+                        value = conduct_record.get(key, '')
+                        if value.strip().lower() not in ('none', ''):
+                            parsed_outliers.update(parse_existing_outliers(value))
                     nominal_map = {p['name'].lower(): p for p in records_nominal}
 
                     # Iterate through 'Everything' sheet to find participants
@@ -2703,28 +2888,32 @@ elif feature == "Update Conduct":
                 st.info("Loading personnel from parade state since no existing data found for this platoon.")
             else:
                 conduct_data = build_fake_conduct_table(platoon, date_obj, records_nominal, records_parade)
-                existing_outliers_str = conduct_record.get(outlier_col_key, "")
-                existing_outliers = parse_existing_outliers(existing_outliers_str)
+                existing_outliers = parse_existing_outliers(outliers_value)
+
+                # Index the loaded rows by name (case-insensitive, first row wins) so each
+                # stored outlier is matched with one lookup instead of a scan of the table
+                conduct_rows_by_name = {}
+                for row in conduct_data:
+                    conduct_rows_by_name.setdefault(row.get("Name", "").strip().lower(), row)
                 
                 # Merge existing outliers into the table
                 for _, outlier_info in existing_outliers.items():
                     name_to_find = outlier_info["original"]
                     status_desc = outlier_info["status_desc"]
                     
-                    for row in conduct_data:
-                        # Match by name (case-insensitive) as the primary identifier
-                        if row.get("Name", "").strip().lower() == name_to_find.strip().lower():
-                            # Check if status description indicates N/A
-                            if status_desc and ("n/a" in status_desc.lower() or status_desc.lower().startswith("n/a")):
-                                row["Attendance_Status"] = "N/A"
-                                # Clear StatusDesc to avoid duplication like "(N/A, N/A)"
-                                row["StatusDesc"] = ""
-                            else:
-                                row["Attendance_Status"] = "No"
-                                # Keep original status description for non-N/A cases
-                                if status_desc:
-                                    row["StatusDesc"] = status_desc
-                            break
+                    # Match by name (case-insensitive) as the primary identifier
+                    row = conduct_rows_by_name.get(name_to_find.strip().lower())
+                    if row is not None:
+                        # Check if status description indicates N/A
+                        if status_desc and ("n/a" in status_desc.lower() or status_desc.lower().startswith("n/a")):
+                            row["Attendance_Status"] = "N/A"
+                            # Clear StatusDesc to avoid duplication like "(N/A, N/A)"
+                            row["StatusDesc"] = ""
+                        else:
+                            row["Attendance_Status"] = "No"
+                            # Keep original status description for non-N/A cases
+                            if status_desc:
+                                row["StatusDesc"] = status_desc
 
         # Final cleanup: ensure StatusDesc is empty for all N/A cases to prevent duplication
         for row in conduct_data:
@@ -2741,8 +2930,6 @@ elif feature == "Update Conduct":
     if "update_conduct_table" in st.session_state and st.session_state.update_conduct_table:
         #st.subheader(f"Edit Conduct Data for Platoon {st.session_state.conduct_platoon}")
         #st.write("Toggle 'Is_Outlier' if not participating, or add new rows for extra people.")
-        sorted_conduct_table = sorted(st.session_state.update_conduct_table, 
-                                 key=lambda x: "ZZZ" if x.get("Rank", "").upper() in NON_CMD_RANKS else x.get("Rank", ""))
         st.write("In order to update, make sure correct platoon chosen and then press load on status for the table to reflect correct platoon. Hence, whenever changing platoon make sure to press load after that to reflect accordingly.")
         st.write("Select attendance status: 'Yes' = attended, 'No' = absent, 'N/A' = not applicable")
         edited_data = st.data_editor(
@@ -2764,15 +2951,26 @@ elif feature == "Update Conduct":
         # --- COMMON SETUP ---
         # Get the conduct record to determine its type and find its row number
         try:
-            conduct_parts = selected_conduct.split(" - ")
-            conduct_date, conduct_name = conduct_parts[0].strip(), conduct_parts[1].strip()
-            
-            all_conduct_values = SHEET_CONDUCTS.get_all_values()
-            row_number = -1
-            for i, row in enumerate(all_conduct_values):
-                if row[0] == conduct_date and row[1] == conduct_name:
-                    row_number = i + 1
-                    break
+            # Match on the selected record's own date and name (normalized as on load);
+            # re-splitting the selectbox label would truncate names containing " - "
+            conduct_date = conduct_record['date']
+            conduct_name = conduct_record['conduct_name']
+
+            def is_selected_conduct_row(row):
+                return (len(row) >= 2 and ensure_date_str(row[0]) == conduct_date
+                        and row[1].strip() == conduct_name)
+
+            # The record remembers its sheet row; read just that row to confirm it hasn't moved
+            # since the records were cached, and only scan the whole sheet if it has
+            row_number = conduct_record['_row_num']
+            current_conduct_row = SHEET_CONDUCTS.row_values(row_number)
+            if not is_selected_conduct_row(current_conduct_row):
+                row_number = -1
+                for i, row in enumerate(SHEET_CONDUCTS.get_all_values()):
+                    if is_selected_conduct_row(row):
+                        row_number = i + 1
+                        current_conduct_row = row
+                        break
             if row_number == -1:
                 st.error("Could not find the conduct to update. It may have been moved or deleted.")
                 st.stop()
@@ -2800,7 +2998,8 @@ elif feature == "Update Conduct":
             if rec: pointer_str += f"Recommendation {idx}:\n{rec}\n"
             pointers_list.append(pointer_str.strip())
         new_pointers = "\n\n".join(pointers_list)
-        SHEET_CONDUCTS.update_cell(row_number, 16, new_pointers)
+        # Conducts cells to rewrite on this row, {column: value}; sent as one batch_update below
+        conduct_row_updates = {16: new_pointers}
 
         # --- LOGIC SPLIT: AD-HOC vs. REGULAR ---
         is_adhoc = conduct_record.get('p/t plt1', '').strip() == "N/A"
@@ -2815,7 +3014,7 @@ elif feature == "Update Conduct":
             non_cmd_total_group = sum(1 for p in edited_data if p["Rank"].upper() in NON_CMD_RANKS)
             cmd_total_group = sum(1 for p in edited_data if p["Rank"].upper() not in NON_CMD_RANKS)
             new_pt_total_value = f"non-cmd: {non_cmd_participating}/{non_cmd_total_group}\ncmd: {cmd_participating}/{cmd_total_group}\nTOTAL: {non_cmd_participating + cmd_participating}/{len(edited_data)}"
-            SHEET_CONDUCTS.update_cell(row_number, 9, new_pt_total_value)
+            conduct_row_updates[9] = new_pt_total_value
 
             # 2. Calculate and update outliers for all relevant platoons
             records_nominal = get_nominal_records(selected_company, SHEET_NOMINAL)
@@ -2844,8 +3043,7 @@ elif feature == "Update Conduct":
             platoon_options = ["1", "2", "3", "4", "5", "Coy HQ"]
             for i, p_opt in enumerate(platoon_options):
                 outlier_col_idx = 10 + i
-                outliers_str = ", ".join(outliers_by_platoon.get(p_opt, [])) or "None"
-                SHEET_CONDUCTS.update_cell(row_number, outlier_col_idx, outliers_str)
+                conduct_row_updates[outlier_col_idx] = ", ".join(outliers_by_platoon.get(p_opt, [])) or "None"
             
         else:
             # --- Regular Platoon Conduct Update Logic ---
@@ -2859,7 +3057,7 @@ elif feature == "Update Conduct":
             
             non_cmd_totals_platoon = sum(1 for p in records_nominal if p.get("platoon", "") == platoon and p.get("rank", "").upper() in NON_CMD_RANKS)
             cmd_totals_platoon = sum(1 for p in records_nominal if p.get("platoon", "") == platoon and p.get("rank", "").upper() not in NON_CMD_RANKS)
-            new_participating = len([r for r in edited_data if r.get('Attendance_Status', 'No') == "Yes"])
+            new_participating = sum(1 for r in edited_data if r.get('Attendance_Status', 'No') == "Yes")
             new_total_platoon = len(edited_data)
             
             new_pt_value = f"non-cmd: {non_cmd_counts}/{non_cmd_totals_platoon}\ncmd: {cmd_counts}/{cmd_totals_platoon}\nTOTAL: {new_participating}/{new_total_platoon}"
@@ -2872,7 +3070,7 @@ elif feature == "Update Conduct":
             else: # Should not happen if UI is correct
                 st.error("Invalid platoon selected.")
                 st.stop()
-            SHEET_CONDUCTS.update_cell(row_number, pt_column_index, new_pt_value)
+            conduct_row_updates[pt_column_index] = new_pt_value
 
             # 2. Calculate and update the specific platoon's outliers (both "No" and "N/A" status count as outliers)
             outliers_for_platoon = []
@@ -2893,11 +3091,13 @@ elif feature == "Update Conduct":
                         outliers_for_platoon.append(f"{base_name} ({row.get('StatusDesc')})")
                     else:
                         outliers_for_platoon.append(base_name)
-            SHEET_CONDUCTS.update_cell(row_number, outlier_column_index, ", ".join(outliers_for_platoon) or "None")
+            conduct_row_updates[outlier_column_index] = ", ".join(outliers_for_platoon) or "None"
 
-            # 3. Recalculate and update the overall P/T Total in column 9
-            all_conduct_values_updated = SHEET_CONDUCTS.get_all_values()
-            current_row_values = all_conduct_values_updated[row_number - 1]
+            # 3. Recalculate the overall P/T Total in column 9 from the row already read above,
+            # with this platoon's new P/T value swapped in
+            current_row_values = list(current_conduct_row)
+            current_row_values += [""] * (pt_column_index - len(current_row_values))
+            current_row_values[pt_column_index - 1] = new_pt_value
             
             total_non_cmd_part, total_non_cmd, total_cmd_part, total_cmd = 0, 0, 0, 0
             # Columns 3 to 8 (P/T PLT1 to P/T Coy HQ)
@@ -2905,24 +3105,31 @@ elif feature == "Update Conduct":
                 if pt_cell and pt_cell != "N/A":
                     lines = pt_cell.split('\n')
                     try:
+                        # "non-cmd: 3/4" -> one partition on the text after the label; int() ignores the spaces
                         non_cmd_line = lines[0]
                         if non_cmd_line.startswith("non-cmd:"):
-                            non_cmd_parts = non_cmd_line.replace("non-cmd:", "").strip().split('/')
-                            total_non_cmd_part += int(non_cmd_parts[0])
-                            total_non_cmd += int(non_cmd_parts[1])
+                            part, _, total = non_cmd_line[len("non-cmd:"):].partition('/')
+                            total_non_cmd_part += int(part)
+                            total_non_cmd += int(total)
                         
                         cmd_line = lines[1]
                         if cmd_line.startswith("cmd:"):
-                            cmd_parts = cmd_line.replace("cmd:", "").strip().split('/')
-                            total_cmd_part += int(cmd_parts[0])
-                            total_cmd += int(cmd_parts[1])
+                            part, _, total = cmd_line[len("cmd:"):].partition('/')
+                            total_cmd_part += int(part)
+                            total_cmd += int(total)
                     except (IndexError, ValueError):
                         continue # Ignore malformed cells
             
             total_part = total_non_cmd_part + total_cmd_part
             total_strength = total_non_cmd + total_cmd
             pt_total = f"non-cmd: {total_non_cmd_part}/{total_non_cmd}\ncmd: {total_cmd_part}/{total_cmd}\nTOTAL: {total_part}/{total_strength}"
-            SHEET_CONDUCTS.update_cell(row_number, 9, pt_total)
+            conduct_row_updates[9] = pt_total
+
+        SHEET_CONDUCTS.batch_update([
+            {'range': gspread.utils.rowcol_to_a1(row_number, col), 'values': [[value]]}
+            for col, value in sorted(conduct_row_updates.items())
+        ], value_input_option='USER_ENTERED')  # same input parsing update_cell used
+        clear_sheet_caches(selected_company, SHEET_CONDUCTS, SHEET_EVERYTHING)
 
         st.success(f"Conduct '{selected_conduct}' updated successfully.")
         logger.info(
@@ -2992,22 +3199,14 @@ elif feature == "Update Parade":
         st.info(f"Loaded {len(data)} personnel for Platoon {platoon} in company '{selected_company}'.")
         logger.info(f"Loaded personnel for Platoon {platoon} in company '{selected_company}' by user '{submitted_by}'.")
 
-        current_statuses = [
-            row for row in records_parade
-            if normalize_name(row.get('platoon', '')) == normalize_name(platoon)
-        ]
-        if current_statuses:
+        # Parade records carry their normalized platoon from load, so only the target needs normalizing
+        target_platoon = normalize_name(platoon)
+        # The statuses themselves are shown in the editor below; this only needs to know one exists
+        has_current_statuses = any(
+            row['_platoon_norm'] == target_platoon for row in records_parade
+        )
+        if has_current_statuses:
             st.subheader("Current Parade Status")
-            formatted_statuses = []
-            for status in current_statuses:
-                formatted_statuses.append({
-                    "Name": status.get("name", ""),
-                    "Platoon": status.get("platoon", ""),
-                    "Status": status.get("status", ""),
-                    "Start_Date": status.get("start_date_ddmmyyyy", ""),
-                    "End_Date": status.get("end_date_ddmmyyyy", "")
-                })
-            #st.write(formatted_statuses)
             logger.info(
                 f"Displayed current parade statuses for platoon {platoon} in company '{selected_company}' "
                 f"by user '{submitted_by}'."
@@ -3018,8 +3217,6 @@ elif feature == "Update Parade":
         st.write("Fill in 'Status', 'Reason', 'Start_Date (DDMMYYYY)', 'End_Date (DDMMYYYY)'")
         st.write("**Note**: If you select 'Others' in the Reason column, you must fill in the 'Others Reason' field with your specific reason.")
         st.write("To delete an existing status, please delete the values in 'Status', 'Start_Date (DDMMYYYY)', 'End_Date (DDMMYYYY)' only.")
-        sorted_conduct_table = sorted(st.session_state.parade_table, 
-                                 key=lambda x: "ZZZ" if x.get("Rank", "").upper() in NON_CMD_RANKS else x.get("Rank", ""))
         edited_data = st.data_editor(
             st.session_state.parade_table,
             num_rows="fixed",
@@ -3031,7 +3228,7 @@ elif feature == "Update Parade":
                 "Rank": st.column_config.TextColumn("Rank", disabled=True),
                 "Reason": st.column_config.SelectboxColumn(
                     "Reason",
-                    options=["", "Musculoskeletal", "Psychological", "Dermatological", "Headache", "URTI", "GE", "Others"],
+                    options=[""] + RSI_RSO_REASONS,
                     required=False
                 ),
                 "Others_Reason": st.column_config.TextColumn(
@@ -3050,19 +3247,20 @@ elif feature == "Update Parade":
         rows_updated = 0
         platoon = str(st.session_state.parade_platoon).strip()
 
-        records_nominal = get_nominal_records(selected_company, SHEET_NOMINAL)
-        records_parade = get_parade_records(selected_company, SHEET_PARADE)
+        # Everything needed below comes from the editor rows and the Parade_State header,
+        # so skip re-reading the full Nominal_Roll / Parade_State sheets here.
 
         # Initialize lists to collect batch requests for each sheet
-        delete_requests = []      # For all deletions in Parade_State
+        rows_to_delete = {}       # Parade_State row number to delete (1-based) -> name, logged once below
         update_requests = []      # For updates in Parade_State
-        nominal_requests = []     # For updates to the Nominal_Roll (leaves)
         append_rows = []          # For any new rows to be appended to Parade_State
 
-        # Retrieve the header to figure out column indices for updates
+        # Re-read Parade_State for the write: the editor's row numbers come from cached records, so each
+        # targeted row is checked against the sheet as it is now, and the header gives current column indices.
+        current_parade_values = SHEET_PARADE.get_all_values()
+        stale_rows = []           # Editor rows whose sheet row no longer holds the same status
         try:
-            header = SHEET_PARADE.row_values(1)
-            header = [h.strip().lower() for h in header]
+            header = [h.strip().lower() for h in (current_parade_values[0] if current_parade_values else [])]
             name_col = header.index("name") + 1
             status_col = header.index("status") + 1
             start_date_col = header.index("start_date_ddmmyyyy") + 1
@@ -3073,6 +3271,17 @@ elif feature == "Update Parade":
             logger.error(f"Required column missing in Parade_State: {ve} in company '{selected_company}'.")
             st.stop()
 
+        def parade_row_unchanged(row_num, entry):
+            """True if sheet row `row_num` still holds the entry's person and original dates."""
+            if row_num > len(current_parade_values):
+                return False
+            sheet_row = current_parade_values[row_num - 1]
+            return (
+                sheet_row[name_col - 1].strip().upper() == entry.get('Name', '').upper()
+                and ensure_date_str(sheet_row[start_date_col - 1]) == entry.get('Start_Date', '')
+                and ensure_date_str(sheet_row[end_date_col - 1]) == entry.get('End_Date', '')
+            )
+
         # Process each row from the data editor
         for idx, row in enumerate(edited_data):
             name_val = ensure_str(row.get("Name", "")).strip()
@@ -3127,19 +3336,10 @@ elif feature == "Update Parade":
 
             # 1) If all key fields are empty on an existing row -> schedule deletion.
             if row_num and not status_val and not start_val and not end_val:
-                delete_requests.append({
-                    'deleteDimension': {
-                        'range': {
-                            'sheetId': SHEET_PARADE.id,
-                            'dimension': 'ROWS',
-                            'startIndex': row_num - 1,  # 0-indexed
-                            'endIndex': row_num
-                        }
-                    }
-                })
-                logger.info(
-                    f"Scheduled deletion of Parade_State row {row_num} for {name_val} in company '{selected_company}'."
-                )
+                if not parade_row_unchanged(row_num, parade_entry):
+                    stale_rows.append(name_val)
+                    continue
+                rows_to_delete[row_num] = name_val
                 rows_updated += 1
                 continue
 
@@ -3151,19 +3351,10 @@ elif feature == "Update Parade":
 
             # 2) If an existing row has no status -> schedule deletion.
             if row_num and not status_val:
-                delete_requests.append({
-                    'deleteDimension': {
-                        'range': {
-                            'sheetId': SHEET_PARADE.id,
-                            'dimension': 'ROWS',
-                            'startIndex': row_num - 1,
-                            'endIndex': row_num
-                        }
-                    }
-                })
-                logger.info(
-                    f"Scheduled deletion of Parade_State row {row_num} for {name_val} in company '{selected_company}'."
-                )
+                if not parade_row_unchanged(row_num, parade_entry):
+                    stale_rows.append(name_val)
+                    continue
+                rows_to_delete[row_num] = name_val
                 rows_updated += 1
                 continue
 
@@ -3184,8 +3375,8 @@ elif feature == "Update Parade":
                 formatted_start_val = ensure_date_str(start_val)
                 formatted_end_val = ensure_date_str(end_val)
                 try:
-                    start_dt = datetime.strptime(formatted_start_val, "%d%m%Y")
-                    end_dt = datetime.strptime(formatted_end_val, "%d%m%Y")
+                    start_dt = _parse_ddmmyyyy(formatted_start_val)
+                    end_dt = _parse_ddmmyyyy(formatted_end_val)
                     if end_dt < start_dt:
                         st.error(f"End date is before start date for {name_val}. Skipping.")
                         logger.error(f"End date before start date for {name_val} in company '{selected_company}'.")
@@ -3209,6 +3400,15 @@ elif feature == "Update Parade":
                     row.get('Start_Date', '') != original_entry.get('Start_Date', '') or
                     row.get('End_Date', '') != original_entry.get('End_Date', '')
                 )
+                # Untouched rows (including Name/Others_Reason) would only rewrite what the sheet
+                # already holds, so they send no requests at all
+                if not is_changed and all(
+                    row.get(col, '') == original_entry.get(col, '') for col in ('Name', 'Others_Reason')
+                ):
+                    continue
+                if not parade_row_unchanged(row_num, original_entry):
+                    stale_rows.append(name_val)
+                    continue
 
                 # Prepare separate "updateCells" requests for each column
                 # (Name, Status, Start, End) to the same row.
@@ -3328,27 +3528,51 @@ elif feature == "Update Parade":
         # Execute the batched operations in a safe order
         # =======================
 
-        # 1) Nominal Roll updates (independent of row references in Parade sheet)
-        if nominal_requests:
-            SHEET_PARADE.spreadsheet.batch_update({"requests": nominal_requests})
-
-        # 2) Parade updates (existing rows only)
-        if update_requests:
-            SHEET_PARADE.spreadsheet.batch_update({"requests": update_requests})
-
-        # 3) Deletions in descending order, so row shifts do not break references
-        if delete_requests:
-            # Sort by 'startIndex' descending so we delete from bottom to top
-            delete_requests = sorted(
-                delete_requests,
-                key=lambda r: r['deleteDimension']['range']['startIndex'],
-                reverse=True
+        # Merge runs of adjacent rows into one deleteDimension each, ordered bottom to top
+        delete_requests = []
+        for row_num in sorted(rows_to_delete, reverse=True):
+            if delete_requests and delete_requests[-1]['deleteDimension']['range']['startIndex'] == row_num:
+                # Extends the run just above the previous one downwards
+                delete_requests[-1]['deleteDimension']['range']['startIndex'] = row_num - 1
+                continue
+            delete_requests.append({
+                'deleteDimension': {
+                    'range': {
+                        'sheetId': SHEET_PARADE.id,
+                        'dimension': 'ROWS',
+                        'startIndex': row_num - 1,  # 0-indexed
+                        'endIndex': row_num
+                    }
+                }
+            })
+
+        # 1) Parade updates (existing rows only)
+        # 2) Deletions in descending order, so row shifts do not break references
+        # The Sheets API applies requests in order, so both go out in one call.
+        # Leaves are derived from Parade_State in Analytics, so nothing is written to Nominal_Roll here.
+        batch_requests = update_requests + delete_requests
+        if batch_requests:
+            SHEET_PARADE.spreadsheet.batch_update({"requests": batch_requests})
+        if rows_to_delete:
+            logger.info(
+                f"Deleted {len(rows_to_delete)} Parade_State row(s) in company '{selected_company}': "
+                + ", ".join(f"row {r} ({name})" for r, name in sorted(rows_to_delete.items()))
             )
-            SHEET_PARADE.spreadsheet.batch_update({"requests": delete_requests})
 
-        # 4) Append brand-new rows
+        # 3) Append brand-new rows
         if append_rows:
             SHEET_PARADE.append_rows(append_rows, value_input_option='USER_ENTERED')
+        clear_sheet_caches(selected_company, SHEET_PARADE)
+
+        if stale_rows:
+            st.warning(
+                "Parade_State changed since it was loaded, so these rows were not updated or deleted: "
+                + ", ".join(stale_rows) + ". Please reload the platoon and try again."
+            )
+            logger.warning(
+                f"Skipped {len(stale_rows)} moved Parade_State row(s) in company '{selected_company}': "
+                + ", ".join(stale_rows)
+            )
 
         st.success("Parade State updated.")
         logger.info(
@@ -3376,62 +3600,46 @@ elif feature == "Analytics":
     if query_mode == "By Personnel":
         st.subheader("Query by Personnel")
         
-        # Date range selection
-        st.subheader("📅 Date Range Selection")
-        col1, col2 = st.columns(2)
-        with col1:
-            start_date = st.date_input(
-                "Start Date",
-                value=datetime(datetime.now().year, 6, 14).date(),
-                key="analytics_start_date"
-            )
-        with col2:
-            end_date = st.date_input(
-                "End Date", 
-                value=datetime.now().date(),
-                key="analytics_end_date"
-            )
-        
-        if start_date > end_date:
-            st.error("Start date cannot be after end date.")
-            st.stop()
-        
-        st.info(f"Analyzing data from {start_date.strftime('%d %b %Y')} to {end_date.strftime('%d %b %Y')}")
-        
         # 1. Get all personnel from nominal roll for the multiselect
         records_nominal = get_nominal_records(selected_company, SHEET_NOMINAL)
         personnel_names = sorted([p['name'] for p in records_nominal if p['name']])
-        commanders = sorted([p['name'] for p in records_nominal if p['name'] and p['rank'].upper() not in NON_CMD_RANKS])
-        non_commanders = sorted([p['name'] for p in records_nominal if p['name'] and p['rank'].upper() in NON_CMD_RANKS])
+        # The commander groups are only used as sets below, so split the roll in one unsorted pass
+        commanders = set()
+        non_commanders = set()
+        for p in records_nominal:
+            if p['name']:
+                if p['rank'].upper() in NON_CMD_RANKS:
+                    non_commanders.add(p['name'])
+                else:
+                    commanders.add(p['name'])
+
+        # Group named personnel by platoon in one pass; every platoon on the roll gets an entry
+        names_by_platoon = defaultdict(list)
+        for p in records_nominal:
+            if p['platoon']:
+                platoon_names_list = names_by_platoon[p['platoon']]
+                if p['name']:
+                    platoon_names_list.append(p['name'])
 
         # Get all unique platoons and create platoon-based options
-        all_platoons = sorted(set(p.get('platoon', 'Coy HQ') for p in records_nominal if p.get('platoon')))
+        all_platoons = sorted(names_by_platoon)
         platoon_options = []
         platoon_personnel_map = {}
+        # Same labels as the parade state message, upper-cased below
+        company_labels = _COMPANY_PLATOON_LABELS.get(selected_company, {})
         
         for platoon in all_platoons:
             # Create user-friendly platoon labels
-            if selected_company == "Support":
-                support_platoon_map = {
-                    "1": "SIGNAL PL", "2": "SCOUT PL", "3": "PIONEER PL", "4": "MORTAR PL"
-                }
-                platoon_label = support_platoon_map.get(platoon, f"PLATOON {platoon}")
+            if platoon in company_labels:
+                platoon_label = company_labels[platoon].upper()
+            elif selected_company == "Support":
+                platoon_label = f"PLATOON {platoon}"
             elif selected_company == "HQ":
-                hq_branch_map = {
-                    "S1": "S1 BRANCH", "S2": "S2 BRANCH", "S3": "S3 BRANCH", 
-                    "S4": "S4 BRANCH", "SSP": "SSP", "BCS": "BCS", "1": "UIP"
-                }
-                platoon_label = hq_branch_map.get(platoon, f"S{platoon} BRANCH")
+                platoon_label = f"S{platoon} BRANCH"
             elif selected_company == "Bravo":
-                bravo_platoon_map = {
-                    "1": "PLT 6", "2": "PLT 7", "3": "PLT 8", "4": "PLT 9", "5": "PLT 10"
-                }
-                platoon_label = bravo_platoon_map.get(platoon, f"PLT {int(platoon) + 5}" if platoon.isdigit() else f"PLATOON {platoon}")
+                platoon_label = f"PLT {int(platoon) + 5}" if platoon.isdigit() else f"PLATOON {platoon}"
             elif selected_company == "Charlie":
-                charlie_platoon_map = {
-                    "1": "PLT 11", "2": "PLT 12", "3": "PLT 13", "4": "PLT 14", "5": "PLT 15"
-                }
-                platoon_label = charlie_platoon_map.get(platoon, f"PLT 1{platoon}" if platoon.isdigit() else f"PLATOON {platoon}")
+                platoon_label = f"PLT 1{platoon}" if platoon.isdigit() else f"PLATOON {platoon}"
             else:
                 if platoon.lower() in ('coy hq', 'hq'):
                     platoon_label = "COY HQ"
@@ -3442,8 +3650,7 @@ elif feature == "Analytics":
             platoon_options.append(option_name)
             
             # Map option name to personnel in that platoon
-            platoon_personnel = [p['name'] for p in records_nominal if p.get('platoon', 'Coy HQ') == platoon and p['name']]
-            platoon_personnel_map[option_name] = platoon_personnel
+            platoon_personnel_map[option_name] = names_by_platoon[platoon]
 
         # 2. Selection UI
         all_personnel_option = "ALL PERSONNEL"
@@ -3451,11 +3658,37 @@ elif feature == "Analytics":
         non_commanders_option = "ALL NON-COMMANDERS"
         special_options = [all_personnel_option, commanders_option, non_commanders_option] + platoon_options
 
-        selected_options = st.multiselect(
-            "Select groups or individuals to query.",
-            options=special_options + personnel_names,
-            default=[]
-        )
+        # Everything below recomputes all eight tabs, so only commit the date range and
+        # selection on submit instead of rerunning per date change or multiselect pick
+        with st.form("analytics_query_form"):
+            # Date range selection
+            st.subheader("📅 Date Range Selection")
+            col1, col2 = st.columns(2)
+            with col1:
+                start_date = st.date_input(
+                    "Start Date",
+                    value=datetime(datetime.now().year, 6, 14).date(),
+                    key="analytics_start_date"
+                )
+            with col2:
+                end_date = st.date_input(
+                    "End Date", 
+                    value=datetime.now().date(),
+                    key="analytics_end_date"
+                )
+
+            selected_options = st.multiselect(
+                "Select groups or individuals to query.",
+                options=special_options + personnel_names,
+                default=[]
+            )
+            st.form_submit_button("Run Query")
+
+        if start_date > end_date:
+            st.error("Start date cannot be after end date.")
+            st.stop()
+        
+        st.info(f"Analyzing data from {start_date.strftime('%d %b %Y')} to {end_date.strftime('%d %b %Y')}")
 
         # Determine the list of people to query using AND logic (intersection)
         group_criteria = []
@@ -3465,9 +3698,9 @@ elif feature == "Analytics":
         if all_personnel_option in selected_options:
             group_criteria.append(set(personnel_names))
         if commanders_option in selected_options:
-            group_criteria.append(set(commanders))
+            group_criteria.append(commanders)
         if non_commanders_option in selected_options:
-            group_criteria.append(set(non_commanders))
+            group_criteria.append(non_commanders)
         
         # Add personnel from selected platoons
         for option in selected_options:
@@ -3490,7 +3723,7 @@ elif feature == "Analytics":
         # Add individual selections (these are always included)
         names_to_query_set.update(individual_selections)
         
-        names_to_query = sorted(list(names_to_query_set))
+        names_to_query = sorted(names_to_query_set)
 
         if not names_to_query:
             st.info("Please select personnel from the list above to see their information.")
@@ -3499,7 +3732,19 @@ elif feature == "Analytics":
         # Data fetching for all tabs
         records_parade = get_allparade_records(selected_company, SHEET_PARADE)
         sheet_everything = worksheets.get("everything")
-        everything_data = sheet_everything.get_all_values() if sheet_everything else []
+        everything_data = get_everything_values(selected_company, sheet_everything)
+
+        # Parse each conduct header's date once for every tab; None marks a malformed header
+        conduct_header_dates = {
+            conduct_header: conduct_header_date(conduct_header)
+            for conduct_header in (everything_data[0][3:] if everything_data else [])
+        }
+
+        # Resolve each header to its column once so the tabs read a person's row by index
+        # instead of calling headers.index() per person per conduct (first occurrence wins, as before)
+        conduct_col_idx = {}
+        for col_idx, conduct_header in enumerate(everything_data[0] if everything_data else []):
+            conduct_col_idx.setdefault(conduct_header, col_idx)
 
         # Create a mapping from name to nominal record for easy lookup
         nominal_map = {p['name'].lower(): p for p in records_nominal}
@@ -3507,29 +3752,25 @@ elif feature == "Analytics":
         # Create tabs
         tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(["Medical Statuses", "Leaves", "RSI/RSO", "Training Attendance", "Conduct Records", "Daily Attendance", "SBO 3", "Pre Lancer"])
 
-        # Helper function to parse dates
-        def parse_ddmmyyyy(d):
-            try:
-                return datetime.strptime(str(d), "%d%m%Y")
-            except (ValueError, TypeError):
-                return None
-
         # Helper function to check if record overlaps with date range
         def record_in_date_range(record, start_date, end_date):
             """Check if a parade record overlaps with the selected date range"""
-            record_start = parse_ddmmyyyy(record.get("start_date_ddmmyyyy", ""))
-            record_end = parse_ddmmyyyy(record.get("end_date_ddmmyyyy", ""))
+            record_start_date = record.get("_start_dt")
+            record_end_date = record.get("_end_dt")
             
-            if not record_start or not record_end:
+            if not record_start_date or not record_end_date:
                 return False
             
-            # Convert to date objects for comparison
-            record_start_date = record_start.date()
-            record_end_date = record_end.date()
-            
             # Check if there's any overlap between record period and selected range
             return not (record_end_date < start_date or record_start_date > end_date)
 
+        # Index the in-range parade records by name once, so each tab does a dict lookup
+        # per person instead of rescanning every parade record
+        parade_in_range_by_name = defaultdict(list)
+        for r in records_parade:
+            if record_in_date_range(r, start_date, end_date):
+                parade_in_range_by_name[r.get('name', '').strip().lower()].append(r)
+
         # TAB 1: MEDICAL STATUSES
         with tab1:
             st.subheader("Medical Statuses")
@@ -3539,11 +3780,7 @@ elif feature == "Analytics":
             group_totals = defaultdict(int)
 
             for name in names_to_query:
-                person_parade_records = [
-                    r for r in records_parade 
-                    if r.get('name', '').strip().lower() == name.strip().lower()
-                    and record_in_date_range(r, start_date, end_date)  # Apply date filtering
-                ]
+                person_parade_records = parade_in_range_by_name.get(name.strip().lower(), [])
                 
                 person_totals = defaultdict(int)
                 medical_details = []
@@ -3552,14 +3789,14 @@ elif feature == "Analytics":
                     status = record.get("status", "").lower()
                     for prefix in display_prefixes:
                         if status.startswith(prefix):
-                            record_start_date = parse_ddmmyyyy(record.get("start_date_ddmmyyyy", ""))
-                            record_end_date = parse_ddmmyyyy(record.get("end_date_ddmmyyyy", ""))
+                            record_start_date = record.get("_start_dt")
+                            record_end_date = record.get("_end_dt")
                             
                             duration = "Unknown"
                             if record_start_date and record_end_date and record_end_date >= record_start_date:
                                 # Calculate only the days within the selected range
-                                overlap_start = max(start_date, record_start_date.date())
-                                overlap_end = min(end_date, record_end_date.date())
+                                overlap_start = max(start_date, record_start_date)
+                                overlap_end = min(end_date, record_end_date)
                                 days = (overlap_end - overlap_start).days + 1
                                 duration = f"{days} day(s)"
                                 person_totals[prefix] += days
@@ -3588,7 +3825,7 @@ elif feature == "Analytics":
 
                 if medical_details:
                     with st.expander(f"View medical history for {name}"):
-                        st.table(medical_details)
+                        st.dataframe(pd.DataFrame(medical_details), use_container_width=True, hide_index=True)
             
             if any(opt in selected_options for opt in special_options) and names_to_query:
                 st.subheader("Group Summary (Medical)")
@@ -3627,11 +3864,7 @@ elif feature == "Analytics":
             group_total_leaves = 0
 
             for name in names_to_query:
-                person_parade_records = [
-                    r for r in records_parade 
-                    if r.get('name', '').strip().lower() == name.strip().lower()
-                    and record_in_date_range(r, start_date, end_date)  # Apply date filtering
-                ]
+                person_parade_records = parade_in_range_by_name.get(name.strip().lower(), [])
                 
                 total_leave_days = 0
                 leave_details = []
@@ -3640,14 +3873,14 @@ elif feature == "Analytics":
                 for record in person_parade_records:
                     status = record.get("status", "").lower()
                     if any(status.startswith(p) for p in leave_prefixes):
-                        record_start_date = parse_ddmmyyyy(record.get("start_date_ddmmyyyy", ""))
-                        record_end_date = parse_ddmmyyyy(record.get("end_date_ddmmyyyy", ""))
+                        record_start_date = record.get("_start_dt")
+                        record_end_date = record.get("_end_dt")
                         
                         duration = "Unknown"
                         if record_start_date and record_end_date and record_end_date >= record_start_date:
                             # Calculate only the days within the selected range
-                            overlap_start = max(start_date, record_start_date.date())
-                            overlap_end = min(end_date, record_end_date.date())
+                            overlap_start = max(start_date, record_start_date)
+                            overlap_end = min(end_date, record_end_date)
                             days = (overlap_end - overlap_start).days + 1
                             total_leave_days += days
                             duration = f"{days} day(s)"
@@ -3672,7 +3905,7 @@ elif feature == "Analytics":
 
                 if leave_details:
                     with st.expander(f"View leave history for {name}"):
-                        st.table(leave_details)
+                        st.dataframe(pd.DataFrame(leave_details), use_container_width=True, hide_index=True)
             
             if any(opt in selected_options for opt in special_options) and names_to_query:
                 st.subheader("Group Summary (Leave)")
@@ -3706,11 +3939,7 @@ elif feature == "Analytics":
             num_weeks = ((end_date - start_date).days + 1) / 7
 
             for name in names_to_query:
-                person_parade_records = [
-                    r for r in records_parade 
-                    if r.get('name', '').strip().lower() == name.strip().lower()
-                    and record_in_date_range(r, start_date, end_date)  # Apply date filtering
-                ]
+                person_parade_records = parade_in_range_by_name.get(name.strip().lower(), [])
                 
                 total_rsi = 0
                 total_rso = 0
@@ -3728,8 +3957,8 @@ elif feature == "Analytics":
                         is_rsi_or_rso = True
 
                     if is_rsi_or_rso:
-                        record_start_date = parse_ddmmyyyy(record.get("start_date_ddmmyyyy", ""))
-                        record_end_date = parse_ddmmyyyy(record.get("end_date_ddmmyyyy", ""))
+                        record_start_date = record.get("_start_dt")
+                        record_end_date = record.get("_end_dt")
                         
                         duration = "Unknown"
                         if record_start_date and record_end_date and record_end_date >= record_start_date:
@@ -3761,7 +3990,7 @@ elif feature == "Analytics":
 
                 if rsi_rso_details:
                     with st.expander(f"View RSI/RSO history for {name}"):
-                        st.table(rsi_rso_details)
+                        st.dataframe(pd.DataFrame(rsi_rso_details), use_container_width=True, hide_index=True)
             
             if any(opt in selected_options for opt in special_options) and names_to_query:
                 st.subheader("Group Summary (RSI/RSO)")
@@ -3823,11 +4052,7 @@ elif feature == "Analytics":
             rsi_rso_records = []
             
             for name in names_to_query:
-                person_parade_records = [
-                    r for r in records_parade 
-                    if r.get('name', '').strip().lower() == name.strip().lower()
-                    and record_in_date_range(r, start_date, end_date)  # Apply date filtering
-                ]
+                person_parade_records = parade_in_range_by_name.get(name.strip().lower(), [])
                 
                 for record in person_parade_records:
                     status = record.get("status", "").strip()
@@ -3840,9 +4065,7 @@ elif feature == "Analytics":
                         
                         # Extract reason from parentheses - look for the last set of parentheses
                         reason = "N/A"
-                        valid_reasons = ["Musculoskeletal", "Psychological", "Dermatological", "Headache", "URTI", "GE", "Others"]
-                        # Create a case-insensitive mapping for comparison
-                        valid_reasons_lower = {r.lower(): r for r in valid_reasons}
+                        valid_reasons_lower = _RSI_RSO_REASONS_BY_LOWER
                         
                         if "(" in status and ")" in status:
                             # Find all parentheses pairs
@@ -3885,14 +4108,14 @@ elif feature == "Analytics":
                         nominal_info = nominal_map.get(name.lower(), {})
                         
                         # Calculate duration
-                        record_start_date = parse_ddmmyyyy(record.get("start_date_ddmmyyyy", ""))
-                        record_end_date = parse_ddmmyyyy(record.get("end_date_ddmmyyyy", ""))
+                        record_start_date = record.get("_start_dt")
+                        record_end_date = record.get("_end_dt")
                         
                         duration = "Unknown"
                         if record_start_date and record_end_date and record_end_date >= record_start_date:
                             # Calculate only the days within the selected range
-                            overlap_start = max(start_date, record_start_date.date())
-                            overlap_end = min(end_date, record_end_date.date())
+                            overlap_start = max(start_date, record_start_date)
+                            overlap_end = min(end_date, record_end_date)
                             days = (overlap_end - overlap_start).days + 1
                             duration = f"{days} day(s)"
                         
@@ -3908,8 +4131,9 @@ elif feature == "Analytics":
             
             if rsi_rso_records:
                 # Create summary statistics
-                rsi_count = len([r for r in rsi_rso_records if r["Status"] == "RSI"])
-                rso_count = len([r for r in rsi_rso_records if r["Status"] == "RSO"])
+                status_counts = Counter(r["Status"] for r in rsi_rso_records)
+                rsi_count = status_counts["RSI"]
+                rso_count = status_counts["RSO"]
                 total_count = len(rsi_rso_records)
                 
                 # Display summary metrics
@@ -3942,12 +4166,10 @@ elif feature == "Analytics":
                 # Filter conduct headers based on date range
                 def conduct_in_date_range(conduct_header):
                     """Check if a conduct header falls within the selected date range"""
-                    try:
-                        conduct_date_str = conduct_header.split(',')[0].strip()
-                        conduct_date = datetime.strptime(conduct_date_str, "%d%m%Y").date()
-                        return start_date <= conduct_date <= end_date
-                    except (ValueError, IndexError):
+                    conduct_date = conduct_header_dates.get(conduct_header)
+                    if conduct_date is None:
                         return False  # Skip malformed headers
+                    return start_date <= conduct_date <= end_date
                 
                 filtered_conduct_headers = [h for h in conduct_headers if conduct_in_date_range(h)]
                 
@@ -3968,7 +4190,7 @@ elif feature == "Analytics":
                         
                         for conduct_name in filtered_conduct_headers:
                             try:
-                                col_idx = headers.index(conduct_name)
+                                col_idx = conduct_col_idx[conduct_name]
                                 attendance_status = person_row[col_idx].strip().lower() if len(person_row) > col_idx else ""
                                 
                                 if attendance_status in ("yes", "no"):
@@ -4060,11 +4282,10 @@ elif feature == "Analytics":
                 today_date = datetime.now().date()
 
                 def parse_header_date(conduct_header):
-                    try:
-                        conduct_date_str = conduct_header.split(',')[0].strip()
-                        return datetime.strptime(conduct_date_str, "%d%m%Y").date()
-                    except (ValueError, IndexError):
-                        return None
+                    return conduct_header_dates.get(conduct_header)
+
+                # Keyword-match each header once rather than once per person
+                header_categories = categorize_conduct_headers(conduct_headers, sbo3_requirements)
 
                 for name in names_to_query:
                     person_row = attendance_map.get(name.lower())
@@ -4078,7 +4299,7 @@ elif feature == "Analytics":
                         if not conduct_date or not (week_0_start <= conduct_date <= today_date):
                             continue
                         try:
-                            col_idx = headers.index(header)
+                            col_idx = conduct_col_idx[header]
                             status = person_row[col_idx].strip().lower() if len(person_row) > col_idx else ""
                             if status == 'yes':
                                 filtered_conducts.append(header)
@@ -4093,20 +4314,11 @@ elif feature == "Analytics":
                     uncategorized_conducts = []
                     
                     for conduct in filtered_conducts:
-                        conduct_name = conduct.lower()
-                        matched_category = None
-                        
-                        # Check which category this conduct belongs to
-                        for category, requirements in sbo3_requirements.items():
-                            for keyword in requirements["keywords"]:
-                                if keyword.lower() in conduct_name:
-                                    categorized_conducts[category].append(conduct)
-                                    matched_category = category
-                                    break
-                            if matched_category:
-                                break
-                        
-                        if not matched_category:
+                        # First matching category wins
+                        matched_categories = header_categories[conduct]
+                        if matched_categories:
+                            categorized_conducts[matched_categories[0]].append(conduct)
+                        else:
                             uncategorized_conducts.append(conduct)
                     
                     with st.expander(f"View conduct records for {rank} {name}"):
@@ -4142,32 +4354,34 @@ elif feature == "Analytics":
 
             for name in names_to_query:
                 # Get all parade records for the person
-                person_parade_records = [
-                    r for r in records_parade 
-                    if r.get('name', '').strip().lower() == name.strip().lower()
-                    and record_in_date_range(r, start_date, end_date)  # Apply date filtering
-                ]
+                person_parade_records = parade_in_range_by_name.get(name.strip().lower(), [])
 
-                absent_dates = set()
+                absent_periods = []
                 for record in person_parade_records:
                     status_prefix = record.get("status", "").lower().split(' ')[0]
                     if status_prefix in LEGEND_STATUS_PREFIXES:
-                        record_start = parse_ddmmyyyy(record.get("start_date_ddmmyyyy", ""))
-                        record_end = parse_ddmmyyyy(record.get("end_date_ddmmyyyy", ""))
+                        record_start = record.get("_start_dt")
+                        record_end = record.get("_end_dt")
 
                         if record_start and record_end:
                             # Find the intersection of the record's date range and the overall query range
-                            overlap_start = max(start_date, record_start.date())
-                            overlap_end = min(end_date, record_end.date())
+                            overlap_start = max(start_date, record_start)
+                            overlap_end = min(end_date, record_end)
 
-                            # If they overlap, add all dates in the overlap period to the set
                             if overlap_start <= overlap_end:
-                                current_date = overlap_start
-                                while current_date <= overlap_end:
-                                    absent_dates.add(current_date)
-                                    current_date += timedelta(days=1)
-                
-                num_absent_days = len(absent_dates)
+                                absent_periods.append((overlap_start, overlap_end))
+
+                # Count distinct absent days by merging the sorted periods,
+                # rather than adding every single date to a set
+                num_absent_days = 0
+                merged_end = None
+                for period_start, period_end in sorted(absent_periods):
+                    if merged_end is None or period_start > merged_end:
+                        num_absent_days += (period_end - period_start).days + 1
+                        merged_end = period_end
+                    elif period_end > merged_end:
+                        num_absent_days += (period_end - merged_end).days
+                        merged_end = period_end
                 present_days = total_days_in_range - num_absent_days
                 attendance_percentage = (present_days / total_days_in_range * 100) if total_days_in_range > 0 else 0
                 group_attendance_percentages.append(attendance_percentage)
@@ -4264,6 +4478,9 @@ elif feature == "Analytics":
                 
                 attendance_map = {row[2].strip().lower(): row for row in everything_data[1:]}
 
+                # Keyword-match each header once rather than once per person per window
+                header_categories = categorize_conduct_headers(conduct_headers, sbo3_requirements)
+
                 # Bound the SBO 3 analysis to the page's selected date range so conducts
                 # outside [start_date, end_date] (e.g. after the End Date) are excluded.
                 range_start_week = max(0, (start_date - week_0_start).days // 7)
@@ -4292,14 +4509,12 @@ elif feature == "Analytics":
                         # Filter conducts in this window
                         window_conducts = []
                         for conduct_header in conduct_headers:
-                            try:
-                                conduct_date_str = conduct_header.split(',')[0].strip()
-                                conduct_date = datetime.strptime(conduct_date_str, "%d%m%Y").date()
-                                if (window_start_date <= conduct_date <= window_end_date
-                                        and start_date <= conduct_date <= end_date):
-                                    window_conducts.append(conduct_header)
-                            except (ValueError, IndexError):
+                            conduct_date = conduct_header_dates.get(conduct_header)
+                            if conduct_date is None:
                                 continue
+                            if (window_start_date <= conduct_date <= window_end_date
+                                    and start_date <= conduct_date <= end_date):
+                                window_conducts.append(conduct_header)
 
                         # Count conducts in this window
                         window_counts = {category: 0 for category in sbo3_requirements.keys()}
@@ -4307,22 +4522,15 @@ elif feature == "Analytics":
                         
                         for conduct_header in window_conducts:
                             try:
-                                col_idx = headers.index(conduct_header)
+                                col_idx = conduct_col_idx[conduct_header]
                                 attendance_status = person_row[col_idx].strip().lower() if len(person_row) > col_idx else ""
                                 
                                 if attendance_status == "yes":
-                                    conduct_name = conduct_header.lower()
-                                    
-                                    # Check which category this conduct belongs to
-                                    for category, requirements in sbo3_requirements.items():
-                                        # Stop counting if this category already reached its target
-                                        if window_counts[category] >= requirements["target"]:
-                                            continue
-                                        for keyword in requirements["keywords"]:
-                                            if keyword.lower() in conduct_name:
-                                                window_counts[category] += 1
-                                                window_completed_conducts[category].append(conduct_header)
-                                                break  # Only count once per category
+                                    # Count towards every matching category that hasn't reached its target
+                                    for category in header_categories[conduct_header]:
+                                        if window_counts[category] < sbo3_requirements[category]["target"]:
+                                            window_counts[category] += 1
+                                            window_completed_conducts[category].append(conduct_header)
                             except ValueError:
                                 continue
                         
@@ -4354,14 +4562,12 @@ elif feature == "Analytics":
                     # Get latest window conducts
                     latest_window_conducts = []
                     for conduct_header in conduct_headers:
-                        try:
-                            conduct_date_str = conduct_header.split(',')[0].strip()
-                            conduct_date = datetime.strptime(conduct_date_str, "%d%m%Y").date()
-                            if (latest_window_start_date <= conduct_date <= latest_window_end_date
-                                    and start_date <= conduct_date <= end_date):
-                                latest_window_conducts.append(conduct_header)
-                        except (ValueError, IndexError):
+                        conduct_date = conduct_header_dates.get(conduct_header)
+                        if conduct_date is None:
                             continue
+                        if (latest_window_start_date <= conduct_date <= latest_window_end_date
+                                and start_date <= conduct_date <= end_date):
+                            latest_window_conducts.append(conduct_header)
                     
                     # Count latest window
                     latest_counts = {category: 0 for category in sbo3_requirements.keys()}
@@ -4369,21 +4575,15 @@ elif feature == "Analytics":
                     
                     for conduct_header in latest_window_conducts:
                         try:
-                            col_idx = headers.index(conduct_header)
+                            col_idx = conduct_col_idx[conduct_header]
                             attendance_status = person_row[col_idx].strip().lower() if len(person_row) > col_idx else ""
                             
                             if attendance_status == "yes":
-                                conduct_name = conduct_header.lower()
-                                
-                                for category, requirements in sbo3_requirements.items():
+                                for category in header_categories[conduct_header]:
                                     # Stop counting if this category already reached its target
-                                    if latest_counts[category] >= requirements["target"]:
-                                        continue
-                                    for keyword in requirements["keywords"]:
-                                        if keyword.lower() in conduct_name:
-                                            latest_counts[category] += 1
-                                            latest_completed_conducts[category].append(conduct_header)
-                                            break
+                                    if latest_counts[category] < sbo3_requirements[category]["target"]:
+                                        latest_counts[category] += 1
+                                        latest_completed_conducts[category].append(conduct_header)
                         except ValueError:
                             continue
                     
@@ -4410,32 +4610,25 @@ elif feature == "Analytics":
 
                     window_conducts = []
                     for conduct_header in conduct_headers:
-                        try:
-                            conduct_date_str = conduct_header.split(',')[0].strip()
-                            conduct_date = datetime.strptime(conduct_date_str, "%d%m%Y").date()
-                            if (window_start_date <= conduct_date <= window_end_date
-                                    and start_date <= conduct_date <= end_date):
-                                window_conducts.append(conduct_header)
-                        except (ValueError, IndexError):
+                        conduct_date = conduct_header_dates.get(conduct_header)
+                        if conduct_date is None:
                             continue
+                        if (window_start_date <= conduct_date <= window_end_date
+                                and start_date <= conduct_date <= end_date):
+                            window_conducts.append(conduct_header)
 
                     window_counts = {category: 0 for category in sbo3_requirements.keys()}
                     window_completed_conducts = {category: [] for category in sbo3_requirements.keys()}
 
                     for conduct_header in window_conducts:
                         try:
-                            col_idx = headers.index(conduct_header)
+                            col_idx = conduct_col_idx[conduct_header]
                             attendance_status = person_row[col_idx].strip().lower() if len(person_row) > col_idx else ""
                             if attendance_status == "yes":
-                                conduct_name = conduct_header.lower()
-                                for category, requirements in sbo3_requirements.items():
-                                    if window_counts[category] >= requirements["target"]:
-                                        continue
-                                    for keyword in requirements["keywords"]:
-                                        if keyword.lower() in conduct_name:
-                                            window_counts[category] += 1
-                                            window_completed_conducts[category].append(conduct_header)
-                                            break
+                                for category in header_categories[conduct_header]:
+                                    if window_counts[category] < sbo3_requirements[category]["target"]:
+                                        window_counts[category] += 1
+                                        window_completed_conducts[category].append(conduct_header)
                         except ValueError:
                             continue
 
@@ -4582,14 +4775,14 @@ elif feature == "Analytics":
                 # Filter conducts from 15 Sep onwards
                 def conduct_after_start_date(conduct_header):
                     """Check if a conduct header is after the Pre Lancer start date"""
-                    try:
-                        conduct_date_str = conduct_header.split(',')[0].strip()
-                        conduct_date = datetime.strptime(conduct_date_str, "%d%m%Y").date()
-                        return conduct_date >= pre_lancer_start
-                    except (ValueError, IndexError):
+                    conduct_date = conduct_header_dates.get(conduct_header)
+                    if conduct_date is None:
                         return False
+                    return conduct_date >= pre_lancer_start
                 
                 filtered_conduct_headers = [h for h in conduct_headers if conduct_after_start_date(h)]
+                # Keyword-match each header once rather than once per person
+                header_categories = categorize_conduct_headers(filtered_conduct_headers, pre_lancer_requirements)
                 
                 for name in names_to_query:
                     person_row = attendance_map.get(name.lower())
@@ -4602,22 +4795,15 @@ elif feature == "Analytics":
                         
                         for conduct_header in filtered_conduct_headers:
                             try:
-                                col_idx = headers.index(conduct_header)
+                                col_idx = conduct_col_idx[conduct_header]
                                 attendance_status = person_row[col_idx].strip().lower() if len(person_row) > col_idx else ""
                                 
                                 if attendance_status == "yes":
-                                    conduct_name = conduct_header.lower()
-                                    
-                                    # Check which category this conduct belongs to
-                                    for category, requirements in pre_lancer_requirements.items():
-                                        # Stop counting if this category already reached its target
-                                        if person_counts[category] >= requirements["target"]:
-                                            continue
-                                        for keyword in requirements["keywords"]:
-                                            if keyword.lower() in conduct_name:
-                                                person_counts[category] += 1
-                                                person_completed_conducts[category].append(conduct_header)
-                                                break  # Only count once per category
+                                    # Count towards every matching category that hasn't reached its target
+                                    for category in header_categories[conduct_header]:
+                                        if person_counts[category] < pre_lancer_requirements[category]["target"]:
+                                            person_counts[category] += 1
+                                            person_completed_conducts[category].append(conduct_header)
                             except ValueError:
                                 continue
                         
@@ -4731,7 +4917,7 @@ elif feature == "Analytics":
         st.info(f"Showing conducts from {start_date.strftime('%d %b %Y')} to {end_date.strftime('%d %b %Y')}")
 
         sheet_everything = worksheets.get("everything")
-        everything_data = sheet_everything.get_all_values() if sheet_everything else []
+        everything_data = get_everything_values(selected_company, sheet_everything)
 
         if not everything_data or len(everything_data) < 2:
             st.warning("The 'Everything' sheet is empty, so conducts cannot be queried.")
@@ -4753,34 +4939,27 @@ elif feature == "Analytics":
         # Filter conduct headers based on date range
         def conduct_in_date_range(conduct_header):
             """Check if a conduct header falls within the selected date range"""
-            try:
-                conduct_date_str = conduct_header.split(',')[0].strip()
-                conduct_date = datetime.strptime(conduct_date_str, "%d%m%Y").date()
-                return start_date <= conduct_date <= end_date
-            except (ValueError, IndexError):
+            conduct_date = conduct_header_date(conduct_header)
+            if conduct_date is None:
                 return False  # Skip malformed headers
+            return start_date <= conduct_date <= end_date
         
         filtered_conduct_headers = [h for h in conduct_headers if conduct_in_date_range(h)]
         
         # Group conducts by SBO 3 categories for better organization
         categorized_conducts = {category: [] for category in sbo3_requirements.keys()}
         uncategorized_conducts = []
+        # Remember each conduct's category so the results below don't re-match keywords
+        conduct_category_by_header = {}
+        header_categories = categorize_conduct_headers(filtered_conduct_headers, sbo3_requirements)
         
         for conduct in filtered_conduct_headers:
-            conduct_name = conduct.lower()
-            matched_category = None
-            
-            # Check which category this conduct belongs to
-            for category, requirements in sbo3_requirements.items():
-                for keyword in requirements["keywords"]:
-                    if keyword.lower() in conduct_name:
-                        categorized_conducts[category].append(conduct)
-                        matched_category = category
-                        break
-                if matched_category:
-                    break
-            
-            if not matched_category:
+            # First matching category wins
+            matched_categories = header_categories[conduct]
+            if matched_categories:
+                categorized_conducts[matched_categories[0]].append(conduct)
+                conduct_category_by_header[conduct] = matched_categories[0]
+            else:
                 uncategorized_conducts.append(conduct)
         
         # Create organized options for multiselect
@@ -4816,22 +4995,14 @@ elif feature == "Analytics":
                 conduct_name_part = header.split(', ')[1]
             except IndexError:
                 conduct_name_part = header
-            match = re.match(r'^(.*\S)\s+(\d+)$', conduct_name_part)
+            match = _CONDUCT_SERIES_RE.match(conduct_name_part)
             if match:
                 base_name, session = match.groups()
                 all_conduct_series[base_name.strip()][int(session)] = header
         
         for conduct_header in selected_conducts:
-            # Determine SBO 3 category for this conduct
-            conduct_category = "Other"
-            conduct_name = conduct_header.lower()
-            for category, requirements in sbo3_requirements.items():
-                for keyword in requirements["keywords"]:
-                    if keyword.lower() in conduct_name:
-                        conduct_category = category
-                        break
-                if conduct_category != "Other":
-                    break
+            # SBO 3 category was resolved when the options were built
+            conduct_category = conduct_category_by_header.get(conduct_header, "Other")
             
             st.markdown(f"#### Results for: `{conduct_header}` ({conduct_category})")
 
@@ -4842,13 +5013,19 @@ elif feature == "Analytics":
                 conduct_name_part = conduct_header.split(', ')[1]
             except IndexError:
                 conduct_name_part = conduct_header
-            match = re.match(r'^(.*\S)\s+(\d+)$', conduct_name_part)
+            match = _CONDUCT_SERIES_RE.match(conduct_name_part)
             if match:
                 base_name_selected, session_selected = match.groups()
                 base_name_selected = base_name_selected.strip()
                 session_selected = int(session_selected)
                 is_series = True
 
+            # Resolve the conduct's column once, not once per person
+            try:
+                col_idx = headers.index(conduct_header)
+            except ValueError:
+                col_idx = None
+
             results = []
             for person in records_nominal:
                 name_lower = person['name'].lower()
@@ -4858,11 +5035,8 @@ elif feature == "Analytics":
                 
                 if person_row:
                     original_status = "Not Marked"
-                    try:
-                        col_idx = headers.index(conduct_header)
+                    if col_idx is not None and len(person_row) > col_idx:
                         original_status = person_row[col_idx].strip().lower()
-                    except (ValueError, IndexError):
-                        pass # Keep as Not Marked
 
                     # For series and non-series, only show the actual marking for the specific session
                     status = original_status
@@ -4927,7 +5101,7 @@ elif feature == "Checklist":
         st.stop()
     
     # Load existing checklist rows for persistence
-    existing_checklist_map = get_checklist_records(SHEET_CHECKLIST)
+    existing_checklist_map = get_checklist_records(selected_company, SHEET_CHECKLIST)
 
     # Load nominal records to get list of commanders
     records_nominal = get_nominal_records(selected_company, SHEET_NOMINAL)
@@ -4945,7 +5119,7 @@ elif feature == "Checklist":
     
     # Load Everything sheet to check platoon participation
     sheet_everything = worksheets.get("everything")
-    everything_data = sheet_everything.get_all_values() if sheet_everything else []
+    everything_data = get_everything_values(selected_company, sheet_everything)
     
     # Determine platoon labels and identifiers once per company
     if selected_company == "Support":
@@ -4964,6 +5138,29 @@ elif feature == "Checklist":
         platoon_labels = ["Platoon 1", "Platoon 2", "Platoon 3", "Platoon 4"]
         platoon_numbers = ["1", "2", "3", "4"]
 
+    # Group the roll by platoon once instead of refiltering it for every conduct
+    personnel_by_platoon = defaultdict(list)
+    for p in records_nominal:
+        personnel_by_platoon[p.get('platoon', '')].append(p)
+
+    # Map each Everything header to its column once; first occurrence wins, as with list.index()
+    everything_col_idx = {}
+    # Likewise index Everything rows by lowercased name; the first matching row wins
+    everything_rows_by_name = {}
+    if everything_data and len(everything_data) > 1:
+        for col_idx, col_header in enumerate(everything_data[0]):
+            everything_col_idx.setdefault(col_header, col_idx)
+        for row in everything_data[1:]:
+            if len(row) > 2:
+                everything_rows_by_name.setdefault(row[2].strip().lower(), row)
+
+    # Normalize each member's name and resolve their Everything row once per platoon,
+    # rather than once per platoon per conduct (None if the person has no row)
+    everything_rows_by_platoon = {
+        plt: [everything_rows_by_name.get(person.get('name', '').strip().lower()) for person in personnel]
+        for plt, personnel in personnel_by_platoon.items()
+    }
+
     # Build checklist data
     checklist_data = []
     
@@ -4994,41 +5191,32 @@ elif feature == "Checklist":
         
         # Check platoon participation from Everything sheet
         if everything_data and len(everything_data) > 1:
-            headers = everything_data[0]
             conduct_header = f"{conduct_date}, {conduct_name}"
+            conduct_col_idx = everything_col_idx.get(conduct_header)
             
             # Check if this conduct exists in Everything sheet
-            if conduct_header in headers:
-                conduct_col_idx = headers.index(conduct_header)
+            if conduct_col_idx is not None:
                 
                 # Check each platoon
                 for plt_label, plt_num in zip(platoon_labels, platoon_numbers):
-                    # Get nominal records for this platoon
-                    platoon_personnel = [
-                        p for p in records_nominal 
-                        if p.get('platoon', '') == plt_num
-                    ]
+                    # Everything rows of this platoon's nominal roll
+                    platoon_rows = everything_rows_by_platoon.get(plt_num, [])
                     
-                    if not platoon_personnel:
+                    if not platoon_rows:
                         row_data[f'{plt_label} Participating Strength'] = 'N/A'
                         continue
                     
                     # Check if any personnel from this platoon have "Yes" status
                     platoon_has_participation = False
                     participating_count = 0
-                    total_count = len(platoon_personnel)
+                    total_count = len(platoon_rows)
                     
-                    for person in platoon_personnel:
-                        person_name = person.get('name', '').strip()
-                        # Find this person in everything_data
-                        for row in everything_data[1:]:
-                            if len(row) > 2 and row[2].strip().lower() == person_name.lower():
-                                if len(row) > conduct_col_idx:
-                                    status = row[conduct_col_idx].strip().lower()
-                                    if status == "yes":
-                                        platoon_has_participation = True
-                                        participating_count += 1
-                                break
+                    for row in platoon_rows:
+                        if row is not None and len(row) > conduct_col_idx:
+                            status = row[conduct_col_idx].strip().lower()
+                            if status == "yes":
+                                platoon_has_participation = True
+                                participating_count += 1
                     
                     # Set Participating Strength
                     if platoon_has_participation:
@@ -5293,8 +5481,10 @@ elif feature == "Checklist":
             except Exception as e:
                 st.error(f"Error creating new conducts: {e}")
                 logger.error(f"Error creating new conducts: {e}")
+            clear_sheet_caches(selected_company, SHEET_CONDUCTS, worksheets["everything"])
 
         updated, appended = save_checklist_records(SHEET_CHECKLIST, records_to_save)
+        clear_sheet_caches(selected_company, SHEET_CHECKLIST)
         st.success(f"Checklist saved. Updated: {updated}, Added: {appended}")
         
         # Clear session state to reload fresh data on next run